@@ -3,7 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 import os
 import asyncio
+import httpx
 import internal_configs as cfg
+from llm_client import createSharedHttpClient
 from monitoring_wrapper import state, patch_multi_agent, initialize_monitoring
 
 # ABOUTME: FastAPI server providing polling endpoints for the agent monitoring system.
@@ -20,6 +22,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# One LLM connection pool for the server's lifetime, so each research run reuses warm connections
+sharedLlmHttpClient = createSharedHttpClient(timeout=httpx.Timeout(None, connect=10.0))
+
 # Initialize and patch on startup
 @app.on_event("startup")
 async def _startupEvent():
@@ -30,6 +35,10 @@ async def _startupEvent():
     agentsDir = Path(__file__).parent / "agent-definition-files"
     initialize_monitoring(agentsDir)
 
+@app.on_event("shutdown")
+async def _shutdownEvent():
+    await sharedLlmHttpClient.aclose()
+
 @app.get("/api/status")
 async def _getStatus():
     """Polling endpoint for the frontend to get current workflow state"""
@@ -55,7 +64,7 @@ async def _startResearch(query: str, mode: str = cfg.config.DEFAULT_RESEARCH_MOD
     """
     from multi_agent_investment import ResearchOrchestrator
     
-    orchestrator = ResearchOrchestrator(mode=mode)
+    orchestrator = await ResearchOrchestrator.create(mode=mode, httpClient=sharedLlmHttpClient)
     
     # Run research in background so API remains responsive
     async def _runResearch():
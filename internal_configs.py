@@ -19,18 +19,31 @@ class AppConfig:
     WEB_SEARCH_MODEL: str = os.getenv("WEB_SEARCH_MODEL", os.getenv("MODEL_NAME", "z-ai/glm-4.5-air:free"))
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openrouter").lower()
     LOCAL_LLM_URL: str = os.getenv("LOCAL_LLM_URL", "http://host.docker.internal:12434").strip()
+    # SSE streaming for OpenRouter; the monitoring token hook only sees non-streamed responses
+    LLM_STREAM_RESPONSES: bool = os.getenv("LLM_STREAM_RESPONSES", "false").strip().lower() == "true"
+    # cache_control breakpoint on the task prompt so providers with prompt caching reuse the prefix across tool rounds
+    LLM_PROMPT_CACHING: bool = os.getenv("LLM_PROMPT_CACHING", "false").strip().lower() == "true"
     
     # Operational Parameters
     MAX_RETRIES: int = 3
     RATE_LIMIT_BACKOFF_CAP: int = 120  # seconds
-    PHASE_THROTTLE_SECONDS: float = 1.0
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # in-flight completions across all agents
+    PHASE_THROTTLE_SECONDS: float = float(os.getenv("PHASE_THROTTLE_SECONDS", "1.0"))  # 0 disables
     OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "./output")
+    CACHE_DIR: str = os.getenv("CACHE_DIR", "./.cache")  # cross-session caches, kept apart from published reports
+    MCP_TOOL_CONCURRENCY: int = 4  # in-flight tool calls per MCP provider
+    WEB_SEARCH_CONCURRENCY: int = int(os.getenv("WEB_SEARCH_CONCURRENCY", "2"))  # in-flight OpenRouter web-plugin requests
+    WEB_SEARCH_CACHE_TTL_SECONDS: int = int(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "21600"))  # 0 disables the in-memory and persisted search caches
+    CONTEXT_TRIM_CHARS: int = int(os.getenv("CONTEXT_TRIM_CHARS", "200000"))  # tool-loop history budget; 0 disables trimming
     
     # Docker & MCP Configuration
     FINANCE_TOOLS_IMAGE: str = "finance-tools"
     GRAPHRAG_IMAGE: str = "graphrag-llamaindex"
     GRAPHRAG_NODE_MODULES_VOLUME: str = "graphrag_node_modules"
     GRAPHRAG_DEFAULT_DB: str = "investment-analysis"
+    # SSE endpoints of long-running MCP servers; empty starts a stdio container per session
+    FINANCE_MCP_URL: str = os.getenv("FINANCE_MCP_URL", "").strip()
+    GRAPHRAG_MCP_URL: str = os.getenv("GRAPHRAG_MCP_URL", "").strip()
     
     # Path Configuration (GraphRAG)
     GRAPHRAG_REGISTRY_DIR: str = os.getenv("GRAPHRAG_REGISTRY_DIR", "").strip()
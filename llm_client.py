@@ -3,14 +3,117 @@
 
 import json
 import logging
+import importlib.util
+import time
+import asyncio
 import httpx
 import anyio
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Tool schemas stay constant across an agent's tool-calling loop, so their JSON is encoded once per list object
+TOOL_ENCODING_CACHE_SIZE = 32
+_encodedToolSchemas: Dict[int, Tuple[List[Dict], str]] = {}
+
+# Long-lived clients multiplex concurrent requests over HTTP/2 when the h2 extra is installed
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+SHARED_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def createSharedHttpClient(**clientOptions) -> httpx.AsyncClient:
+    """Build a pooled client meant to live for the whole session rather than a single request."""
+    return httpx.AsyncClient(http2=HTTP2_ENABLED, limits=SHARED_CLIENT_LIMITS, **clientOptions)
+
+
+def _encodeChatPayload(payload: Dict, tools: Optional[List[Dict]] = None) -> bytes:
+    """
+    Serialize a chat completion request body.
+    The tools array is spliced in from its cached encoding instead of being re-serialized on every iteration.
+    """
+    body = json.dumps(payload, separators=(",", ":"))
+    if not tools:
+        return body.encode("utf-8")
+
+    cachedEntry = _encodedToolSchemas.get(id(tools))
+    if cachedEntry is None or cachedEntry[0] is not tools:
+        if len(_encodedToolSchemas) >= TOOL_ENCODING_CACHE_SIZE:
+            _encodedToolSchemas.pop(next(iter(_encodedToolSchemas)))
+        # Holding the list itself keeps its id from being reused by another object
+        cachedEntry = (tools, json.dumps(tools, separators=(",", ":")))
+        _encodedToolSchemas[id(tools)] = cachedEntry
+
+    return f'{body[:-1]},"tools":{cachedEntry[1]},"tool_choice":"auto"}}'.encode("utf-8")
+
+
+def _withCacheBreakpoint(messages: List[Dict]) -> List[Dict]:
+    """
+    Return a copy of the conversation whose latest plain-text user turn carries an ephemeral cache_control marker.
+    Providers with prompt caching then bill the stable system + task prefix as cached input on later tool rounds.
+    """
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            markedMessage = dict(message, content=[
+                {"type": "text", "text": message["content"], "cache_control": {"type": "ephemeral"}}
+            ])
+            return messages[:index] + [markedMessage] + messages[index + 1:]
+    return messages
+
+
+async def _collectStreamedCompletion(response: httpx.Response) -> Dict:
+    """
+    Consume an SSE chat completion stream and reassemble it into the non-streamed response shape.
+    Content deltas are joined once at the end; tool-call fragments are merged by their index.
+    """
+    contentParts: List[str] = []
+    toolCalls: Dict[int, Dict] = {}
+    finishReason = None
+    usage = None
+
+    async for line in response.aiter_lines():
+        # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank separators
+        if not line.startswith("data: "):
+            continue
+        data = line[6:].strip()
+        if data == "[DONE]":
+            break
+
+        chunk = json.loads(data)
+        if "error" in chunk:
+            raise RuntimeError(f"Stream aborted by provider: {chunk['error']}")
+        if chunk.get("usage"):
+            usage = chunk["usage"]
+
+        for choice in chunk.get("choices", []):
+            delta = choice.get("delta") or {}
+            if delta.get("content"):
+                contentParts.append(delta["content"])
+            for callDelta in delta.get("tool_calls") or []:
+                toolCall = toolCalls.setdefault(callDelta.get("index", 0), {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""}
+                })
+                if callDelta.get("id"):
+                    toolCall["id"] = callDelta["id"]
+                functionDelta = callDelta.get("function") or {}
+                toolCall["function"]["name"] += functionDelta.get("name") or ""
+                toolCall["function"]["arguments"] += functionDelta.get("arguments") or ""
+            finishReason = choice.get("finish_reason") or finishReason
+
+    message = {"role": "assistant", "content": "".join(contentParts) or None}
+    if toolCalls:
+        message["tool_calls"] = [toolCalls[index] for index in sorted(toolCalls)]
+
+    completion = {"choices": [{"index": 0, "message": message, "finish_reason": finishReason}]}
+    if usage:
+        completion["usage"] = usage
+    return completion
+
 class ILlmClient(ABC):
     """Interface for LLM interactions to enable swapping real/mock implementations."""
     
@@ -18,6 +121,10 @@ class ILlmClient(ABC):
     async def chatCompletion(self, model: str, messages: List[Dict], tools: Optional[List[Dict]] = None) -> Dict:
         pass
 
+    async def aclose(self):
+        """Release pooled connections; clients without persistent transport have nothing to close."""
+        pass
+
 class LocalLlmClient(ILlmClient):
     """Client for local LLM interactions using OpenAI-compatible API format (Ollama/Docker Model Runner)."""
     
@@ -46,10 +153,7 @@ class LocalLlmClient(ILlmClient):
             "temperature": self.temperature,
             "max_tokens": self.maxTokens
         }
-        
-        if tools:
-            payload["tools"] = tools
-            payload["tool_choice"] = "auto"
+        requestBody = _encodeChatPayload(payload, tools)
 
         max_retries = 3
         retry_delay = 10 # seconds
@@ -57,7 +161,11 @@ class LocalLlmClient(ILlmClient):
         for attempt in range(max_retries):
             try:
                 async with httpx.AsyncClient(timeout=600.0) as client:
-                    response = await client.post(endpoint, json=payload)
+                    response = await client.post(
+                        endpoint,
+                        headers={"Content-Type": "application/json"},
+                        content=requestBody
+                    )
                     
                     if response.status_code == 503:
                         logger.warning(f"Local LLM is still loading model (503). Retrying in {retry_delay}s... (Attempt {attempt + 1}/{max_retries})")
@@ -81,36 +189,96 @@ class LocalLlmClient(ILlmClient):
 class OpenRouterClient(ILlmClient):
     """Production client for OpenRouter API."""
     
-    def __init__(self, apiKey: str, baseUrl: str, maxRetries: int = 3, backoffCap: int = 60):
+    def __init__(
+        self,
+        apiKey: str,
+        baseUrl: str,
+        maxRetries: int = 3,
+        backoffCap: int = 60,
+        streamResponses: bool = False,
+        maxConcurrency: int = 4,
+        promptCaching: bool = False,
+        httpClient: Optional[httpx.AsyncClient] = None
+    ):
         self.apiKey = apiKey
         self.baseUrl = baseUrl
         self.maxRetries = maxRetries
         self.backoffCap = backoffCap
+        self.streamResponses = streamResponses
+        self.promptCaching = promptCaching
+        # An injected client is borrowed: its owner keeps the pool warm across sessions and closes it
+        self.httpClient = httpClient
+        self.ownsHttpClient = httpClient is None
+        # One backpressure point for every agent sharing this client
+        self.requestLimiter = asyncio.Semaphore(maxConcurrency)
+        self.rateLimitedUntil = 0.0  # monotonic deadline set by the latest 429; all callers wait it out
+
+    def _getHttpClient(self) -> httpx.AsyncClient:
+        """Create the pooled client on first use so every attempt reuses its open connections."""
+        if self.httpClient is None:
+            self.httpClient = createSharedHttpClient(timeout=httpx.Timeout(None, connect=10.0))
+        return self.httpClient
+
+    async def aclose(self):
+        """Close the pooled client; a later request transparently opens a new one. Borrowed clients stay open."""
+        if self.httpClient is not None and self.ownsHttpClient:
+            httpClient, self.httpClient = self.httpClient, None
+            await httpClient.aclose()
+
+    @asynccontextmanager
+    async def _requestSlot(self) -> AsyncIterator[None]:
+        """Hold a request slot once any shared rate-limit deadline has passed; waiting never holds a slot."""
+        while True:
+            rateLimitWait = self.rateLimitedUntil - time.monotonic()
+            if rateLimitWait > 0:
+                await anyio.sleep(rateLimitWait)
+            await self.requestLimiter.acquire()
+            # A 429 that arrived while this call queued for the slot still applies to it
+            if self.rateLimitedUntil <= time.monotonic():
+                break
+            self.requestLimiter.release()
+        try:
+            yield
+        finally:
+            self.requestLimiter.release()
 
     async def chatCompletion(self, model: str, messages: List[Dict], tools: Optional[List[Dict]] = None) -> Dict:
         """
         Execute a chat completion request with built-in retry logic and rate limit handling.
+        When streaming is enabled the SSE deltas are reassembled into the same response shape.
         """
+        # The caller's history is never mutated; only the outgoing copy carries the breakpoint
+        if self.promptCaching and len(messages) >= 2:
+            messages = _withCacheBreakpoint(messages)
         payload = {
             "model": model,
             "messages": messages
         }
-        if tools:
-            payload["tools"] = tools
-            payload["tool_choice"] = "auto"
+        if self.streamResponses:
+            payload["stream"] = True
+        requestBody = _encodeChatPayload(payload, tools)
+        requestHeaders = {
+            "Authorization": f"Bearer {self.apiKey}",
+            "Content-Type": "application/json"
+        }
 
-        for retryAttempt in range(self.maxRetries):
+        client = self._getHttpClient()
+        maxRetries = self.maxRetries
+        for retryAttempt in range(maxRetries):
             try:
-                async with httpx.AsyncClient(timeout=None) as client:
+                # The slot is released before any backoff sleep, so throttled calls never hold it
+                async with self._requestSlot():
                     logger.debug(f"Requesting LLM: {model} (Attempt {retryAttempt + 1})")
                     
+                    if self.streamResponses:
+                        async with client.stream("POST", self.baseUrl, headers=requestHeaders, content=requestBody) as response:
+                            response.raise_for_status()
+                            return await _collectStreamedCompletion(response)
+
                     response = await client.post(
                         self.baseUrl,
-                        headers={
-                            "Authorization": f"Bearer {self.apiKey}",
-                            "Content-Type": "application/json"
-                        },
-                        json=payload
+                        headers=requestHeaders,
+                        content=requestBody
                     )
                     response.raise_for_status()
                     return response.json()
@@ -123,26 +291,34 @@ class OpenRouterClient(ILlmClient):
                     except ValueError:
                         backoffSeconds = 60
                     
+                    # The final attempt has no retry to wait for, so it fails straight away
+                    if retryAttempt == maxRetries - 1: break
                     logger.warning(f"Rate limited (429). Backing off for {backoffSeconds}s.")
-                    await anyio.sleep(backoffSeconds)
+                    # Shared deadline: concurrent callers pause too instead of drawing their own 429s
+                    self.rateLimitedUntil = max(self.rateLimitedUntil, time.monotonic() + backoffSeconds)
                 else:
                     logger.error(f"API Error {httpError.response.status_code}")
-                    if retryAttempt == self.maxRetries - 1: raise
+                    if retryAttempt == maxRetries - 1: raise
                     await anyio.sleep(2 ** retryAttempt)
                     
             except Exception as unexpectedError:
                 logger.error(f"Unexpected failure: {unexpectedError}")
-                if retryAttempt == self.maxRetries - 1: raise
+                if retryAttempt == maxRetries - 1: raise
                 await anyio.sleep(2 ** retryAttempt)
                 
-        raise RuntimeError(f"Failed to get LLM response after {self.maxRetries} attempts.")
+        raise RuntimeError(f"Failed to get LLM response after {maxRetries} attempts.")
 
 def getLLMClient(
     provider: str, 
     model: str, 
     apiKey: Optional[str] = None, 
     baseUrl: Optional[str] = None,
-    backoffCap: int = 60
+    maxRetries: int = 3,
+    backoffCap: int = 60,
+    streamResponses: bool = False,
+    maxConcurrency: int = 4,
+    promptCaching: bool = False,
+    httpClient: Optional[httpx.AsyncClient] = None
 ) -> ILlmClient:
     """Factory function to instantiate the correct LLM client based on provider."""
     provider = provider.lower()
@@ -155,5 +331,10 @@ def getLLMClient(
         return OpenRouterClient(
             apiKey=apiKey or "", 
             baseUrl=baseUrl or "https://openrouter.ai/api/v1/chat/completions",
-            backoffCap=backoffCap
+            maxRetries=maxRetries,
+            backoffCap=backoffCap,
+            streamResponses=streamResponses,
+            maxConcurrency=maxConcurrency,
+            promptCaching=promptCaching,
+            httpClient=httpClient
         )
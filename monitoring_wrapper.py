@@ -181,7 +181,50 @@ def patch_multi_agent():
 
         ResearchOrchestrator.executeResearchSession = _wrappedResearch
         
-        # 2. Patch Agent.performResearchTask to capture usage and activity
+        # 2. Patch httpx.AsyncClient.post once to capture usage and activity; concurrent agents
+        # share the patch and are told apart by the currentAgent context variable
+        originalPost = httpx.AsyncClient.post
+        
+        @functools.wraps(originalPost)
+        async def _wrappedPost(clientSelf, url, **kwargs):
+            response = await originalPost(clientSelf, url, **kwargs)
+            name = currentAgent.get()
+            if name is not None and response.is_success:
+                try:
+                    data = response.json()
+                    usage = data.get("usage", {})
+                    if usage:
+                        p_tokens = usage.get("prompt_tokens", 0)
+                        c_tokens = usage.get("completion_tokens", 0)
+                        total = usage.get("total_tokens", p_tokens + c_tokens)
+                        
+                        if total > 0:
+                            if name in state.agents:
+                                state.agents[name]["tokensUsed"] += total
+                            state.promptTokens += p_tokens
+                            state.completionTokens += c_tokens
+                            state.totalTokens += total
+                        
+                    # Capture thoughts/activity
+                    choices = data.get("choices", [])
+                    if choices:
+                        content = choices[0].get("message", {}).get("content")
+                        if content:
+                            state.toolCalls.append({
+                                "id": f"thought_{datetime.now().strftime('%H%M%S%f')}",
+                                "toolName": "THOUGHT",
+                                "agentName": name,
+                                "arguments": {"thought": content[:500] + ("..." if len(content) > 500 else "")},
+                                "timestamp": datetime.now().isoformat(),
+                                "executionTimeMs": 0
+                            })
+                except:
+                    pass
+            return response
+
+        httpx.AsyncClient.post = _wrappedPost
+        
+        # 3. Patch Agent.performResearchTask to track agent status and scope attribution to the agent
         originalAnalyze = Agent.performResearchTask
         
         @functools.wraps(originalAnalyze)
@@ -195,45 +238,6 @@ def patch_multi_agent():
                 state.agents[name]["currentTask"] = query
                 state.agents[name]["progress"] = 25
             
-            originalPost = httpx.AsyncClient.post
-            
-            async def _wrappedPost(clientSelf, url, **kwargs):
-                response = await originalPost(clientSelf, url, **kwargs)
-                if response.is_success:
-                    try:
-                        data = response.json()
-                        usage = data.get("usage", {})
-                        if usage:
-                            p_tokens = usage.get("prompt_tokens", 0)
-                            c_tokens = usage.get("completion_tokens", 0)
-                            total = usage.get("total_tokens", p_tokens + c_tokens)
-                            
-                            if total > 0:
-                                if name in state.agents:
-                                    state.agents[name]["tokensUsed"] += total
-                                state.promptTokens += p_tokens
-                                state.completionTokens += c_tokens
-                                state.totalTokens += total
-                            
-                        # Capture thoughts/activity
-                        choices = data.get("choices", [])
-                        if choices:
-                            content = choices[0].get("message", {}).get("content")
-                            if content:
-                                state.toolCalls.append({
-                                    "id": f"thought_{datetime.now().strftime('%H%M%S%f')}",
-                                    "toolName": "THOUGHT",
-                                    "agentName": name,
-                                    "arguments": {"thought": content[:500] + ("..." if len(content) > 500 else "")},
-                                    "timestamp": datetime.now().isoformat(),
-                                    "executionTimeMs": 0
-                                })
-                    except:
-                        pass
-                return response
-
-            httpx.AsyncClient.post = _wrappedPost
-            
             try:
                 result = await originalAnalyze(self, query)
                 if name in state.agents:
@@ -247,12 +251,11 @@ def patch_multi_agent():
                     state.agents[name]["currentTask"] = f"Error: {str(e)}"
                 raise
             finally:
-                httpx.AsyncClient.post = originalPost
                 currentAgent.reset(token)
 
         Agent.performResearchTask = _wrappedAnalyze
         
-        # 3. Patch McpToolProvider.executeMcpTool to track tool activity
+        # 4. Patch McpToolProvider.executeMcpTool to track tool activity
         originalCall = McpToolProvider.executeMcpTool
         
         @functools.wraps(originalCall)
@@ -282,7 +285,7 @@ def patch_multi_agent():
 
         McpToolProvider.executeMcpTool = _wrappedCallTool
         
-        # 4. Patch output_pruner.pruneAgentOutput to track savings
+        # 5. Patch output_pruner.pruneAgentOutput to track savings
         try:
             import output_pruner
             originalPrune = output_pruner.pruneAgentOutput
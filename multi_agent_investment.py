@@ -8,18 +8,26 @@ import json
 import logging
 import re
 import ast
-from typing import Dict, List, Optional, Any, Union
+import string
+import functools
+import importlib.util
+import sqlite3
+import uuid
+import time
+from typing import Dict, List, Optional, Any, Union, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from contextlib import AsyncExitStack
 import httpx
 import anyio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.client.sse import sse_client
 from output_pruner import pruneAgentOutput
+from persistent_store import PersistentKeyValueStore
 import internal_configs as cfg
-from llm_client import OpenRouterClient, ILlmClient, getLLMClient
+from llm_client import OpenRouterClient, ILlmClient, getLLMClient, createSharedHttpClient
 
 # Environment variables are loaded automatically by internal_configs
 
@@ -36,6 +44,79 @@ OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 OPENROUTER_CHAT_ENDPOINT = f"{OPENROUTER_BASE_URL}/chat/completions"
 OPENROUTER_RESPONSES_ENDPOINT = f"{OPENROUTER_BASE_URL}/responses"
 
+# Research modes that run each analysis track
+FUNDAMENTAL_TRACK_MODES = frozenset({"fundamental", "all"})
+MOMENTUM_TRACK_MODES = frozenset({"momentum", "all"})
+
+# Report placeholder when the fundamental track (and its final thesis) did not run
+MOMENTUM_ONLY_RECOMMENDATION = "N/A (Momentum-only Mode)"
+
+# Responses API content parts that carry user-facing text
+RESPONSES_TEXT_PART_TYPES = frozenset({"text", "output_text"})
+# Every tool bridge reports a failed call as text starting with this prefix
+TOOL_ERROR_PREFIX = "Error"
+# Stand-in content for tool results elided once an agent's history exceeds the context budget
+TRIMMED_TOOL_RESULT = "[Earlier tool output omitted to stay within the context budget]"
+# Compact Responses API web-search body, split around its per-call fields
+SEARCH_PAYLOAD_HEAD = '{"model":'
+SEARCH_PAYLOAD_QUERY_PREFIX = ',"input":[{"type":"message","role":"user","content":[{"type":"input_text","text":'
+SEARCH_PAYLOAD_RESULTS_PREFIX = '}]}],"plugins":[{"id":"web","max_results":'
+SEARCH_PAYLOAD_TAIL = '}]}'
+# In-memory web search results held per agent before least-recently-used eviction
+WEB_SEARCH_MEMORY_CACHE_SIZE = 1024
+# Whitespace runs collapse to one space when normalizing search cache keys
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+# Agent persona specifications bootstrapped by every orchestrator
+DEFAULT_AGENTS_DIR = Path(__file__).parent / "agent-definition-files"
+AGENT_SPEC_FILES = ("qualitative_agent.md", "quantitative_agent.md", "synthesis_agent.md", "momentum_agent.md")
+# Parsed agent specs kept per process, keyed by path and modification time
+AGENT_SPEC_CACHE_SIZE = 32
+# One match classifies an agent-spec line; alternation order mirrors the parser's precedence
+AGENT_SPEC_LINE_PATTERN = re.compile(
+    r"(?P<title># )|(?P<skills>## Skills)|(?P<personality>## Personality)"
+    r"|(?P<specialization>## Specialization)|(?P<heading>##)|(?P<bullet>- )"
+)
+AGENT_SPEC_SECTIONS = frozenset({"skills", "personality", "specialization"})
+
+
+def _compileTemplate(template: str) -> Tuple[List[bytes], Tuple[str, ...]]:
+    """
+    Parse a str.format template once into interleaved UTF-8 pieces for repeated rendering.
+    Literal text sits pre-encoded at even indexes and field slots at odd indexes,
+    so a render encodes only the field values, then does one slice assignment plus one join.
+    """
+    templatePieces, fieldNames = [], []
+    pendingLiteral = ""
+    for literal, fieldName, formatSpec, conversion in string.Formatter().parse(template):
+        if formatSpec or conversion:
+            raise ValueError(f"Report templates support plain fields only, got '{{{fieldName}!{conversion}:{formatSpec}}}'")
+        # Escaped braces split the literal text into several parse results
+        pendingLiteral += literal
+        if fieldName is not None:
+            templatePieces.extend((pendingLiteral.encode('utf-8'), b""))
+            fieldNames.append(fieldName)
+            pendingLiteral = ""
+    templatePieces.append(pendingLiteral.encode('utf-8'))
+    return templatePieces, tuple(fieldNames)
+
+
+def _renderTemplate(compiledTemplate: Tuple[List[bytes], Tuple[str, ...]], **fields) -> bytes:
+    """Fill a compiled template as UTF-8 bytes without re-parsing or re-encoding its literal text."""
+    templatePieces, fieldNames = compiledTemplate
+    renderedPieces = templatePieces.copy()
+    renderedPieces[1::2] = [str(fields[fieldName]).encode('utf-8') for fieldName in fieldNames]
+    return b"".join(renderedPieces)
+
+
+# One pre-joined report template per research mode, so export renders a single template without branching
+REPORT_TEMPLATES_BY_MODE = {
+    mode: _compileTemplate(
+        cfg.MARKDOWN_REPORT_TEMPLATE + (cfg.MOMENTUM_REPORT_SECTION if mode in MOMENTUM_TRACK_MODES else "")
+    )
+    for mode in cfg.config.RESEARCH_MODES
+}
+
 
 
 @dataclass
@@ -53,43 +134,63 @@ class ResearchResult:
     """Container for agent research results"""
     agentName: str
     analysis: str
-    timestamp: datetime
+    timestamp: datetime  # When the agent task was dispatched
     error: Optional[str] = None
 
 
 class McpToolProvider:
     """Bridges OpenRouter API with Local Docker MCP Servers to provide specialized toolsets."""
     
-    def __init__(self, name: str, serverParams: StdioServerParameters):
+    def __init__(self, name: str, serverParams: StdioServerParameters, serverUrl: Optional[str] = None):
         self.name = name
         self.serverParams = serverParams
+        # An already-running server reached over SSE; stdio (one container per session) is the fallback
+        self.serverUrl = serverUrl
         self.session: Optional[ClientSession] = None
-        self.exitStack = AsyncExitStack()
+        # Transport and session contexts are closed in reverse order during cleanup
+        self.transportContext = None
+        self.sessionContext: Optional[ClientSession] = None
         self.toolsLibrary = {}  # Cache tool definitions
+        self.toolSchemas: List[Dict] = []  # OpenAI-format schemas, converted once per connect
+        # Each provider gets its own ceiling; MCP stdio servers largely process calls serially
+        self.callLimiter = asyncio.Semaphore(cfg.config.MCP_TOOL_CONCURRENCY)
 
     async def connect(self):
-        """Establishes deterministic stdio connection to the Dockerized MCP host."""
+        """Establishes a connection to the Dockerized MCP host over SSE or stdio."""
         if self.session:
             return
 
-        logger.info(f"Connecting to McpToolProvider [{self.name}]: {self.serverParams.command} {' '.join(self.serverParams.args)}...")
+        if self.serverUrl:
+            logger.info(f"Connecting to McpToolProvider [{self.name}]: {self.serverUrl}...")
+        else:
+            logger.info(f"Connecting to McpToolProvider [{self.name}]: {self.serverParams.command} {' '.join(self.serverParams.args)}...")
         
         try:
-            # Start the stdio transport
-            transport = await self.exitStack.enter_async_context(
-                stdio_client(self.serverParams)
-            )
-            self.read, self.write = transport
+            # Start the transport: SSE to a warm server when configured, otherwise a stdio container
+            transportContext = sse_client(self.serverUrl) if self.serverUrl else stdio_client(self.serverParams)
+            self.read, self.write = await transportContext.__aenter__()
+            self.transportContext = transportContext
             
             # Start the MCP session
-            self.session = await self.exitStack.enter_async_context(
-                ClientSession(self.read, self.write)
-            )
+            sessionContext = ClientSession(self.read, self.write)
+            self.session = await sessionContext.__aenter__()
+            self.sessionContext = sessionContext
             await self.session.initialize()
             
             # Fetch available tools and cache them
             result = await self.session.list_tools()
             self.toolsLibrary = {tool.name: tool for tool in result.tools}
+            self.toolSchemas = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.name,
+                        "description": tool.description,
+                        "parameters": tool.inputSchema  # MCP inputSchema maps 1:1 to OpenAI parameters
+                    }
+                }
+                for tool in result.tools
+            ]
             logger.info(f"Connected to [{self.name}]. Loaded {len(self.toolsLibrary)} tools.")
         except Exception as exc:
             logger.error(f"Failed to connect to McpToolProvider [{self.name}]: {exc}")
@@ -99,27 +200,17 @@ class McpToolProvider:
         """Convert MCP tool definitions to OpenRouter/OpenAI tool call schema."""
         if not self.session:
             await self.connect()
-            
-        toolSchemas = []
-        for tool in self.toolsLibrary.values():
-            toolSchemas.append({
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.inputSchema  # MCP inputSchema maps 1:1 to OpenAI parameters
-                }
-            })
-        return toolSchemas
+        return self.toolSchemas
 
     async def executeMcpTool(self, name: str, arguments: Dict) -> str:
         """Execute the requested tool on the Docker container and return structured text results."""
         if not self.session:
             raise RuntimeError(f"McpToolProvider Session [{self.name}] not connected")
             
-        logger.info(f"Executing MCP Tool [{self.name}]: {name}({json.dumps(arguments)})")
+        logger.info("Executing MCP Tool [%s]: %s(%s)", self.name, name, arguments)
         try:
-            result = await self.session.call_tool(name, arguments)
+            async with self.callLimiter:
+                result = await self.session.call_tool(name, arguments)
             # Standard MCP result extraction
             if hasattr(result, 'content') and result.content:
                 return result.content[0].text
@@ -129,91 +220,197 @@ class McpToolProvider:
             return f"Error: {str(exc)}"
 
     async def cleanup(self):
-        """Standard teardown for all active session resources."""
+        """Standard teardown for all active session resources; a no-op when nothing is open."""
+        if self.sessionContext is None and self.transportContext is None:
+            return
         logger.info(f"Cleaning up McpToolProvider [{self.name}]")
-        try:
-            # Shield the cleanup to prevent it from being cancelled while running
-            with anyio.CancelScope(shield=True):
-                await self.exitStack.aclose()
-        except Exception as exc:
-            # We catch everything during cleanup to ensure we don't crash during shutdown
-            logger.debug(f"Interruption or error during cleanup of [{self.name}]: {exc}")
+        # Shield the cleanup to prevent it from being cancelled while running
+        with anyio.CancelScope(shield=True):
+            for context in (self.sessionContext, self.transportContext):
+                if context is None:
+                    continue
+                try:
+                    await context.__aexit__(None, None, None)
+                except Exception as exc:
+                    # We catch everything during cleanup to ensure we don't crash during shutdown
+                    logger.debug(f"Interruption or error during cleanup of [{self.name}]: {exc}")
+        self.session = None
+        self.sessionContext = None
+        self.transportContext = None
 
 
 class WebSearchAgent:
     """Specialized agent using OpenRouter Responses API for web search with task-safe caching"""
     
-    def __init__(self, apiKey: str, model: str = cfg.config.WEB_SEARCH_MODEL):
+    def __init__(
+        self,
+        apiKey: str,
+        model: str = cfg.config.WEB_SEARCH_MODEL,
+        persistentCache: Optional[PersistentKeyValueStore] = None
+    ):
         self.apiKey = apiKey
         self.model = model
         self.baseUrl = OPENROUTER_RESPONSES_ENDPOINT
-        self.searchCache = {}  # Semantic cache to avoid redundant web hits
-        self.cacheLock = asyncio.Lock()
+        self.payloadHead = SEARCH_PAYLOAD_HEAD + json.dumps(model) + SEARCH_PAYLOAD_QUERY_PREFIX
+        # Semantic cache to avoid redundant web hits: cacheKey -> (stored monotonic time, result), LRU ordered
+        self.searchCache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.memoryTtlSeconds = cfg.config.WEB_SEARCH_CACHE_TTL_SECONDS  # 0 disables the in-memory tier as well
+        self.persistentCache = persistentCache  # Cross-session tier behind the in-memory cache
+        self.inflightSearches: Dict[str, asyncio.Future] = {}  # cacheKey -> result shared by concurrent callers
+        self.requestLimiter = asyncio.Semaphore(cfg.config.WEB_SEARCH_CONCURRENCY)
+        self.httpClient: Optional[httpx.AsyncClient] = None  # Opened on the first live search, reused until aclose()
+
+    def _getHttpClient(self) -> httpx.AsyncClient:
+        """Return the session-wide client so searches skip the TCP/TLS handshake after the first one."""
+        if self.httpClient is None:
+            self.httpClient = createSharedHttpClient(
+                timeout=httpx.Timeout(None, connect=10.0),
+                headers={
+                    "Authorization": f"Bearer {self.apiKey}",
+                    "Content-Type": "application/json",
+                }
+            )
+        return self.httpClient
         
     async def search(self, query: str, maxResults: int = 3) -> str:
         """
         Execute web search via OpenRouter Responses API.
-        Implements single-flight pattern via lock to prevent redundant concurrent searches.
+        Implements single-flight per query: concurrent callers for the same query share one lookup,
+        while distinct queries proceed in parallel.
         """
         # Normalize query for caching
-        cacheKey = query.strip().lower()
+        cacheKey = self._normalizeQuery(query)
         
-        async with self.cacheLock:
-            if cacheKey in self.searchCache:
-                logger.info(f"WebSearchAgent: Serving cached result for query: '{query}'")
-                return self.searchCache[cacheKey]
-                
-            logger.info(f"WebSearchAgent: Performing live web search for: '{query}'")
-            
-            payload = {
-                "model": self.model,
-                "input": [
-                    {
-                        "type": "message",
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "input_text",
-                                "text": query
-                            }
-                        ]
-                    }
-                ],
-                "plugins": [{"id": "web", "max_results": maxResults}]
-            }
-            
+        # Check-and-register runs without an await, so it is atomic on the event loop
+        cachedResult = self._getCachedResult(cacheKey)
+        if cachedResult is not None:
+            logger.info(f"WebSearchAgent: Serving cached result for query: '{query}'")
+            return cachedResult
+
+        pendingSearch = self.inflightSearches.get(cacheKey)
+        if pendingSearch is not None:
+            logger.info(f"WebSearchAgent: Joining in-flight search for query: '{query}'")
             try:
-                async with httpx.AsyncClient(timeout=None) as client:
-                    response = await client.post(
-                        self.baseUrl,
-                        headers={
-                            "Authorization": f"Bearer {self.apiKey}",
-                            "Content-Type": "application/json",
-                        },
-                        json=payload
-                    )
-                    response.raise_for_status()
-                    result = response.json()
-                    
-                    # Extract content from Responses API output
-                    outputContent = ""
-                    if "output" in result and result["output"]:
-                        for outputItem in result["output"]:
-                            # Skip reasoning/encrypted items, look for message types
-                            if outputItem.get("type") == "message":
-                                contentList = outputItem.get("content", [])
-                                for part in contentList:
-                                    partType = part.get("type")
-                                    if partType in ["text", "output_text"]:
-                                        outputContent += part.get("text", "")
-                            
-                    finalResult = outputContent.strip() or "No information found on the web for this query."
-                    self.searchCache[cacheKey] = finalResult
-                    return finalResult
-                    
-            except Exception as exc:
-                logger.error(f"WebSearchAgent: API failure: {exc}")
-                return f"Error performing web search: {str(exc)}"
+                return await asyncio.shield(pendingSearch)
+            except asyncio.CancelledError:
+                # Only a cancelled leader hands the lookup over; a cancellation aimed at this caller propagates
+                if not pendingSearch.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.search(query, maxResults)
+
+        pendingSearch = asyncio.get_running_loop().create_future()
+        self.inflightSearches[cacheKey] = pendingSearch
+        try:
+            finalResult = await self._resolveSearch(query, cacheKey, maxResults)
+        except Exception as searchError:
+            pendingSearch.set_exception(searchError)
+            # Joined callers re-raise the error themselves; retrieving it here keeps asyncio quiet when none joined
+            pendingSearch.exception()
+            raise
+        except BaseException:
+            pendingSearch.cancel()
+            raise
+        finally:
+            del self.inflightSearches[cacheKey]
+
+        pendingSearch.set_result(finalResult)
+        return finalResult
+
+    async def _resolveSearch(self, query: str, cacheKey: str, maxResults: int) -> str:
+        """Resolve a cache miss from the persisted store, falling back to a live API call."""
+        persistedResult = await self._loadPersistedResult(cacheKey)
+        if persistedResult is not None:
+            logger.info(f"WebSearchAgent: Serving persisted result for query: '{query}'")
+            self._cacheResult(cacheKey, persistedResult)
+            return persistedResult
+            
+        logger.info(f"WebSearchAgent: Performing live web search for: '{query}'")
+        
+        # Only the query and result count are serialized per call; the rest is fixed JSON
+        requestBody = "".join((
+            self.payloadHead,
+            json.dumps(query),
+            SEARCH_PAYLOAD_RESULTS_PREFIX,
+            json.dumps(maxResults),
+            SEARCH_PAYLOAD_TAIL
+        )).encode("utf-8")
+        
+        try:
+            async with self.requestLimiter:
+                response = await self._getHttpClient().post(self.baseUrl, content=requestBody)
+                response.raise_for_status()
+                result = response.json()
+                
+                # Extract content from Responses API output, skipping reasoning/encrypted items
+                outputContent = "".join(
+                    part.get("text", "")
+                    for outputItem in result.get("output") or ()
+                    if outputItem.get("type") == "message"
+                    for part in outputItem.get("content", ())
+                    if part.get("type") in RESPONSES_TEXT_PART_TYPES
+                )
+                finalResult = outputContent.strip() or "No information found on the web for this query."
+                self._cacheResult(cacheKey, finalResult)
+                
+        except Exception as exc:
+            logger.error(f"WebSearchAgent: API failure: {exc}")
+            return f"Error performing web search: {str(exc)}"
+
+        await self._persistResult(cacheKey, finalResult)
+        return finalResult
+
+    @staticmethod
+    def _normalizeQuery(query: str) -> str:
+        """Fold case, whitespace runs and trailing punctuation so trivially different phrasings share a key."""
+        return WHITESPACE_RUN_PATTERN.sub(" ", query).strip().lower().rstrip("?.!,;: ")
+
+    def _getCachedResult(self, cacheKey: str) -> Optional[str]:
+        """Return a fresh in-memory result and mark it recently used; expired entries are dropped."""
+        cachedEntry = self.searchCache.get(cacheKey)
+        if cachedEntry is None:
+            return None
+        storedAt, result = cachedEntry
+        if time.monotonic() - storedAt > self.memoryTtlSeconds:
+            del self.searchCache[cacheKey]
+            return None
+        self.searchCache.move_to_end(cacheKey)
+        return result
+
+    def _cacheResult(self, cacheKey: str, result: str):
+        """Store a result, evicting the least recently used entries beyond the size bound."""
+        if self.memoryTtlSeconds <= 0:
+            return
+        self.searchCache[cacheKey] = (time.monotonic(), result)
+        self.searchCache.move_to_end(cacheKey)
+        while len(self.searchCache) > WEB_SEARCH_MEMORY_CACHE_SIZE:
+            self.searchCache.popitem(last=False)
+
+    async def _loadPersistedResult(self, cacheKey: str) -> Optional[str]:
+        """Look up the cross-session cache; storage faults degrade to a cache miss."""
+        if not self.persistentCache:
+            return None
+        try:
+            return await self.persistentCache.get(cacheKey)
+        except sqlite3.Error as exc:
+            logger.warning(f"WebSearchAgent: Persistent cache read failed for '{cacheKey}': {exc}")
+            return None
+
+    async def _persistResult(self, cacheKey: str, result: str):
+        """Write a live result through to the cross-session cache."""
+        if not self.persistentCache:
+            return
+        try:
+            await self.persistentCache.put(cacheKey, result)
+        except sqlite3.Error as exc:
+            logger.warning(f"WebSearchAgent: Persistent cache write failed for '{cacheKey}': {exc}")
+
+    async def aclose(self):
+        """Release resources held beyond a single search."""
+        if self.httpClient is not None:
+            httpClient, self.httpClient = self.httpClient, None
+            await httpClient.aclose()
+        if self.persistentCache:
+            self.persistentCache.close()
 
 
 class InternalAgentAdapter:
@@ -226,20 +423,22 @@ class InternalAgentAdapter:
         self.name = name
         self.webAgent = webAgent
         self.toolsLibrary = cfg.WEB_SEARCH_TOOL_DEFINITION
-
-    async def getOpenAiToolSchema(self) -> List[Dict]:
-        """Convert internal tool definitions to OpenAI tool call schema."""
-        toolSchemas = []
-        for tool in self.toolsLibrary.values():
-            toolSchemas.append({
+        # Internal tool definitions are static, so the OpenAI schema is built once
+        self.toolSchemas = [
+            {
                 "type": "function",
                 "function": {
                     "name": tool["name"],
                     "description": tool["description"],
                     "parameters": tool["inputSchema"]
                 }
-            })
-        return toolSchemas
+            }
+            for tool in self.toolsLibrary.values()
+        ]
+
+    async def getOpenAiToolSchema(self) -> List[Dict]:
+        """Convert internal tool definitions to OpenAI tool call schema."""
+        return self.toolSchemas
 
     async def executeMcpTool(self, name: str, arguments: Dict) -> str:
         """Route tool call to the internal WebSearchAgent."""
@@ -268,6 +467,11 @@ class Agent:
         self.model = model
         self.mcpProvider = mcpProvider
         self.agentAdapter = agentAdapter
+        # Merged tool list is reused while the providers keep returning the same schema lists
+        self.availableTools: List[Dict] = []
+        self.toolSchemaSources: List[List[Dict]] = []
+        # The persona never changes after load, so every task starts from the same system message
+        self.systemMessage = {"role": "system", "content": self._buildSystemPrompt()}
     
     def _buildSystemPrompt(self) -> str:
         """Constructs the system prompt from the agent's full markdown specification."""
@@ -279,18 +483,14 @@ class Agent:
         Adheres to agentic focus with deterministic tool execution.
         """
         interactionHistory = [
-            {"role": "system", "content": self.profile.fullSpec},
+            self.systemMessage,
             {"role": "user", "content": query}
         ]
         
-        availableTools = []
-        if self.mcpProvider:
-            mcpTools = await self.mcpProvider.getOpenAiToolSchema()
-            availableTools.extend(mcpTools)
-            
-        if self.agentAdapter:
-            agentTools = await self.agentAdapter.getOpenAiToolSchema()
-            availableTools.extend(agentTools)
+        availableTools = await self._collectAvailableTools()
+        # Identical (tool, arguments) requests within one task reuse the first result
+        toolResultCache: Dict[Tuple[str, str], str] = {}
+        historyChars = len(self.systemMessage["content"]) + len(query)
         
         toolIterationCount = 0
         MAX_TOOL_CYCLES = 10 
@@ -315,28 +515,46 @@ class Agent:
 
                 # CASE B: Tool Calls Requested by LLM
                 toolIterationCount += 1
+                latestTurnStart = len(interactionHistory)
                 interactionHistory.append(assistantMessage) 
+                historyChars += len(assistantMessage.get("content") or "")
                 
-                for requestedTool in assistantMessage["tool_calls"]:
+                requestedTools = assistantMessage["tool_calls"]
+                callKeys = []
+                pendingCalls: Dict[Tuple[str, str], Tuple[str, Dict]] = {}
+                for requestedTool in requestedTools:
                     targetToolName = requestedTool["function"]["name"]
                     toolArguments = json.loads(requestedTool["function"]["arguments"])
-                    
-                    logger.info(f"{self.profile.name}: LLM suggested tool -> {targetToolName}")
-                    
-                    # Route the tool call to the correct bridge
-                    if self.mcpProvider and targetToolName in self.mcpProvider.toolsLibrary:
-                        executionResult = await self.mcpProvider.executeMcpTool(targetToolName, toolArguments)
-                    elif self.agentAdapter and targetToolName in self.agentAdapter.toolsLibrary:
-                        executionResult = await self.agentAdapter.executeMcpTool(targetToolName, toolArguments)
+                    callKey = (targetToolName, json.dumps(toolArguments, sort_keys=True))
+                    callKeys.append(callKey)
+                    if callKey not in toolResultCache:
+                        pendingCalls.setdefault(callKey, (targetToolName, toolArguments))
                     else:
-                        executionResult = f"Error: Tool {targetToolName} not found in this agent's bridge context."
-                    
+                        logger.info(f"{self.profile.name}: Reusing earlier result for repeated tool call -> {targetToolName}")
+                
+                # Tool calls from one turn are independent I/O, so run them concurrently;
+                # gather keeps results in request order for the tool-role messages
+                executionResults = await asyncio.gather(
+                    *(self._dispatchToolCall(*pendingCall) for pendingCall in pendingCalls.values())
+                )
+                turnResults = dict(zip(pendingCalls, executionResults))
+                # Failures (MCP timeouts, rate limits) are not reused, so a retried call runs again
+                toolResultCache.update(
+                    (callKey, executionResult) for callKey, executionResult in turnResults.items()
+                    if not executionResult.startswith(TOOL_ERROR_PREFIX)
+                )
+                for requestedTool, callKey in zip(requestedTools, callKeys):
+                    executionResult = turnResults[callKey] if callKey in turnResults else toolResultCache[callKey]
                     interactionHistory.append({
                         "role": "tool",
                         "tool_call_id": requestedTool["id"],
-                        "name": targetToolName,
+                        "name": requestedTool["function"]["name"],
                         "content": executionResult
                     })
+                    historyChars += len(executionResult)
+
+                if cfg.config.CONTEXT_TRIM_CHARS > 0 and historyChars > cfg.config.CONTEXT_TRIM_CHARS:
+                    historyChars = self._trimToolHistory(interactionHistory, historyChars, latestTurnStart)
                 
             except Exception as e:
                 logger.error(f"{self.profile.name}: Critical Agent Error: {e}")
@@ -344,6 +562,47 @@ class Agent:
         
         raise RuntimeError(f"{self.profile.name}: Exceeded maximum tool iteration cycles.")
 
+    async def _collectAvailableTools(self) -> List[Dict]:
+        """Merge provider and adapter schemas, rebuilding only when a source list has changed."""
+        schemaSources = []
+        if self.mcpProvider:
+            schemaSources.append(await self.mcpProvider.getOpenAiToolSchema())
+        if self.agentAdapter:
+            schemaSources.append(await self.agentAdapter.getOpenAiToolSchema())
+
+        if len(schemaSources) != len(self.toolSchemaSources) or any(
+            current is not cached for current, cached in zip(schemaSources, self.toolSchemaSources)
+        ):
+            self.availableTools = [tool for schemas in schemaSources for tool in schemas]
+            self.toolSchemaSources = schemaSources
+        return self.availableTools
+
+    @staticmethod
+    def _trimToolHistory(interactionHistory: List[Dict], historyChars: int, latestTurnStart: int) -> int:
+        """
+        Elide the oldest tool results until the history fits the context budget.
+        Tool messages keep their slot because every tool_call_id needs a response; the newest turn is never trimmed.
+        """
+        for message in interactionHistory[:latestTurnStart]:
+            if historyChars <= cfg.config.CONTEXT_TRIM_CHARS:
+                break
+            if message["role"] != "tool" or message["content"] == TRIMMED_TOOL_RESULT:
+                continue
+            historyChars -= len(message["content"]) - len(TRIMMED_TOOL_RESULT)
+            message["content"] = TRIMMED_TOOL_RESULT
+        return historyChars
+
+    async def _dispatchToolCall(self, targetToolName: str, toolArguments: Dict) -> str:
+        """Route a single LLM tool call to the bridge that owns the tool."""
+        logger.info(f"{self.profile.name}: LLM suggested tool -> {targetToolName}")
+        
+        # Route the tool call to the correct bridge
+        if self.mcpProvider and targetToolName in self.mcpProvider.toolsLibrary:
+            return await self.mcpProvider.executeMcpTool(targetToolName, toolArguments)
+        if self.agentAdapter and targetToolName in self.agentAdapter.toolsLibrary:
+            return await self.agentAdapter.executeMcpTool(targetToolName, toolArguments)
+        return f"Error: Tool {targetToolName} not found in this agent's bridge context."
+
     async def provideRecursiveAnalysis(self, question: str, originalAnalysis: str) -> str:
         """
         Answer follow-up clarification questions from synthesis agent during recursive refinement.
@@ -367,23 +626,21 @@ class AgentSpecLoader:
         """
         Parse the hybrid markdown structure to extract metadata and system prompt.
         """
-        lines = content.split('\n')
         name, skills, personality, specialization = "", [], [], ""
         current_section = None
         
-        for line in lines:
+        for line in content.splitlines():
             stripped = line.strip()
-            if stripped.startswith('# ') and not name:
-                name = stripped[2:].strip()
-            elif stripped.startswith('## Skills'):
-                current_section = 'skills'
-            elif stripped.startswith('## Personality'):
-                current_section = 'personality'
-            elif stripped.startswith('## Specialization'):
-                current_section = 'specialization'
-            elif stripped.startswith('##'):
+            lineMatch = AGENT_SPEC_LINE_PATTERN.match(stripped)
+            lineKind = lineMatch.lastgroup if lineMatch else None
+            if lineKind == 'title':
+                if not name:
+                    name = stripped[2:].strip()
+            elif lineKind in AGENT_SPEC_SECTIONS:
+                current_section = lineKind
+            elif lineKind == 'heading':
                 current_section = None
-            elif stripped.startswith('- ') and current_section in ['skills', 'personality']:
+            elif lineKind == 'bullet' and current_section in ('skills', 'personality'):
                 if current_section == 'skills':
                     skills.append(stripped[2:].strip())
                 else:
@@ -397,19 +654,29 @@ class AgentSpecLoader:
         
         return AgentProfile(name, skills, personality, specialization, content)
 
+    @staticmethod
+    def loadFromPath(specPath: Path) -> AgentProfile:
+        """Load a spec file, reusing the parsed profile until the file is modified."""
+        return _loadAgentProfile(os.fspath(specPath), os.stat(specPath).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=AGENT_SPEC_CACHE_SIZE)
+def _loadAgentProfile(specPath: str, modifiedNs: int) -> AgentProfile:
+    """Read and parse one spec file; the mtime argument only invalidates the cache entry."""
+    with open(specPath, 'r', encoding='utf-8') as specFile:
+        return AgentSpecLoader.loadFromMarkdown(specFile.read())
+
 
 class ResearchOrchestrator:
     """Orchestrates the multi-agent investment research lifecycle across distributed tool providers."""
     
-    # --- Workflow Configuration ---
-    PHASE_THROTTLE_SECONDS = cfg.config.PHASE_THROTTLE_SECONDS
-    
     def __init__(
         self, 
         agentsDir: str = None,
         modelName: str = None,
         mode: str = cfg.config.DEFAULT_RESEARCH_MODE,
-        outputDirectory: str = cfg.config.OUTPUT_DIR
+        outputDirectory: str = cfg.config.OUTPUT_DIR,
+        httpClient: Optional[httpx.AsyncClient] = None
     ):
         self.mode = mode.lower()
         if self.mode not in cfg.config.RESEARCH_MODES:
@@ -427,19 +694,26 @@ class ResearchOrchestrator:
             model=cfg.config.PRIMARY_MODEL,
             apiKey=self.apiKey,
             baseUrl=cfg.config.LOCAL_LLM_URL if cfg.config.LLM_PROVIDER == "local" else OPENROUTER_CHAT_ENDPOINT,
-            backoffCap=cfg.config.RATE_LIMIT_BACKOFF_CAP
+            maxRetries=cfg.config.MAX_RETRIES,
+            backoffCap=cfg.config.RATE_LIMIT_BACKOFF_CAP,
+            streamResponses=cfg.config.LLM_STREAM_RESPONSES,
+            maxConcurrency=cfg.config.LLM_MAX_CONCURRENCY,
+            promptCaching=cfg.config.LLM_PROMPT_CACHING,
+            httpClient=httpClient  # Long-lived callers pass one pool so later sessions skip the handshakes
         )
         
         # Determine absolute path for agent persona specifications
         if agentsDir is None:
-            agentsDir = str(Path(__file__).parent / "agent-definition-files")
+            agentsDir = str(DEFAULT_AGENTS_DIR)
         self.agentsDir = Path(agentsDir)
         
         # Model configuration
         self.model = modelName or cfg.config.PRIMARY_MODEL
             
         self.outputDir = Path(outputDirectory)
-        self.outputDir.mkdir(exist_ok=True)
+        # The output directory exists for the orchestrator's whole lifetime, so exports write into it directly
+        self.outputDir.mkdir(parents=True, exist_ok=True)
+        self.outputDirStr = os.fspath(self.outputDir)  # Plain-string base for per-export artifact paths
         
         # GraphRAG path validation (required for Docker sibling volume mounts)
         registryPath = cfg.config.GRAPHRAG_REGISTRY_DIR
@@ -454,7 +728,7 @@ class ResearchOrchestrator:
                 command="docker",
                 args=["run", "-i", "--rm", cfg.config.FINANCE_TOOLS_IMAGE],
                 env=None
-            )),
+            ), serverUrl=cfg.config.FINANCE_MCP_URL or None),
             "graphrag": McpToolProvider("graphrag", StdioServerParameters(
                 command="docker",
                 args=[
@@ -472,12 +746,21 @@ class ResearchOrchestrator:
                     "npx", "tsx", "mcp_server.ts"
                 ],
                 env=None
-            ))
+            ), serverUrl=cfg.config.GRAPHRAG_MCP_URL or None)
         }
         
         # Initialize specialized Web Search Agent
         webSearchModel = cfg.config.WEB_SEARCH_MODEL
-        self.webSearchAgent = WebSearchAgent(self.apiKey, model=webSearchModel)
+        searchResultStore = None
+        if cfg.config.WEB_SEARCH_CACHE_TTL_SECONDS > 0:
+            cacheDir = Path(cfg.config.CACHE_DIR)
+            cacheDir.mkdir(parents=True, exist_ok=True)
+            searchResultStore = PersistentKeyValueStore(
+                cacheDir / "web_search_cache.sqlite",
+                tableName="search_cache",
+                ttlSeconds=cfg.config.WEB_SEARCH_CACHE_TTL_SECONDS
+            )
+        self.webSearchAgent = WebSearchAgent(self.apiKey, model=webSearchModel, persistentCache=searchResultStore)
         self.webSearchAdapter = InternalAgentAdapter("web-search", self.webSearchAgent)
         
         # Bootstrap qualitative and quantitative intelligence agents
@@ -503,6 +786,26 @@ class ResearchOrchestrator:
         )
         
         logger.info(f"ResearchOrchestrator online. Mode: {self.mode} | Model: {self.model}")
+
+    @classmethod
+    async def create(
+        cls,
+        agentsDir: str = None,
+        modelName: str = None,
+        mode: str = cfg.config.DEFAULT_RESEARCH_MODE,
+        outputDirectory: str = cfg.config.OUTPUT_DIR,
+        httpClient: Optional[httpx.AsyncClient] = None
+    ) -> "ResearchOrchestrator":
+        """
+        Construct an orchestrator from async code without blocking the event loop on spec files.
+        All specs are read and parsed concurrently in worker threads, so __init__ only hits the profile cache.
+        """
+        specDir = Path(agentsDir) if agentsDir is not None else DEFAULT_AGENTS_DIR
+        await asyncio.gather(*(
+            anyio.to_thread.run_sync(AgentSpecLoader.loadFromPath, specDir / filename)
+            for filename in AGENT_SPEC_FILES
+        ))
+        return cls(agentsDir, modelName, mode, outputDirectory, httpClient)
     
     def _initializeAgentFromSpec(
         self, 
@@ -511,10 +814,7 @@ class ResearchOrchestrator:
         agentAdapter: Optional[InternalAgentAdapter] = None
     ) -> Agent:
         """Instantiate a specialized Agent from a markdown persona specification."""
-        fullPath = self.agentsDir / filename
-        with open(fullPath, 'r', encoding='utf-8') as specFile:
-            rawSpec = specFile.read()
-        agentProfile = AgentSpecLoader.loadFromMarkdown(rawSpec)
+        agentProfile = AgentSpecLoader.loadFromPath(self.agentsDir / filename)
         
         return Agent(
             agentProfile, 
@@ -525,9 +825,14 @@ class ResearchOrchestrator:
         )
     
     async def cleanup(self):
-        """Teardown of all active mcp tool providers."""
-        for provider in self.toolProviders.values():
-            await provider.cleanup()
+        """Teardown of all active mcp tool providers and pooled HTTP clients."""
+        # One shielded scope for the whole teardown; providers closed by their host tasks return immediately
+        with anyio.CancelScope(shield=True):
+            async with anyio.create_task_group() as cleanupGroup:
+                for provider in self.toolProviders.values():
+                    cleanupGroup.start_soon(provider.cleanup)
+            await self.webSearchAgent.aclose()
+            await self.llmClient.aclose()
 
     async def executeResearchSession(self, investmentQuery: str) -> Dict:
         """
@@ -536,13 +841,43 @@ class ResearchOrchestrator:
         logger.info(f"\n[RESEARCH QUERY] {investmentQuery}\n")
         
         try:
-            # Standby verification for tool providers
-            for providerName, provider in self.toolProviders.items():
-                try:
-                    await provider.connect()
-                except Exception as connectionErr:
-                    logger.warning(f"Standby failure for Tool Provider [{providerName}]: {connectionErr}")
+            async with anyio.create_task_group() as providerGroup:
+                # Standby verification for tool providers, booted concurrently
+                async with anyio.create_task_group() as standbyGroup:
+                    for providerName, provider in self.toolProviders.items():
+                        standbyGroup.start_soon(providerGroup.start, self._hostToolProvider, providerName, provider)
+
+                sessionResult = await self._runResearchPhases(investmentQuery)
+                # Releases the hosting tasks, which tear their providers down concurrently
+                providerGroup.cancel_scope.cancel()
+            return sessionResult
+        finally:
+            await self.cleanup()
+
+    async def _hostToolProvider(self, providerName: str, provider: McpToolProvider, *, task_status=anyio.TASK_STATUS_IGNORED):
+        """
+        Keep one tool provider connected for the session from its own task.
+        The stdio transport and MCP session hold task-bound cancel scopes, so connect and cleanup must share a task.
+        """
+        try:
+            try:
+                await provider.connect()
+            except Exception as connectionErr:
+                logger.warning(f"Standby failure for Tool Provider [{providerName}]: {connectionErr}")
+            task_status.started()
+            await anyio.sleep_forever()
+        finally:
+            await provider.cleanup()
 
+    async def _runResearchPhases(self, investmentQuery: str) -> Dict:
+        """Run the research phases for the configured mode and export the final artifact."""
+        # Phase output is journaled as it lands; the suffix keeps it out of the .md paper listings, and the
+        # random token keeps concurrent sessions started in the same second from sharing a journal
+        journalPath = os.path.join(
+            self.outputDirStr,
+            f"research_{self.mode}_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}.md.partial"
+        )
+        try:
             # Define State Map
             researchStateMap = {
                 "qualitative": {"analysis": "", "clarification": ""},
@@ -558,35 +893,50 @@ class ResearchOrchestrator:
             # Persist RAW analysis for final report generation
             researchStateMap["qualitative"]["analysis"] = qualResults.analysis
             researchStateMap["quantitative"]["analysis"] = quantResults.analysis
+            await self._journalPhase(
+                journalPath,
+                ("Qualitative Analysis", qualResults.analysis),
+                ("Quantitative Analysis", quantResults.analysis)
+            )
             
             # Prune for handoff: Optimize for inter-agent context windows
             prunedQual = pruneAgentOutput(qualResults.analysis, agentType="qualitative")
             prunedQuant = pruneAgentOutput(quantResults.analysis, agentType="quantitative")
 
             if qualResults.error or quantResults.error:
+                 await self._reportKeptJournal(journalPath)
                  return {"error": f"Phase 1 Failure: Qual({qualResults.error}) Quant({quantResults.error})"}
             
-            await anyio.sleep(self.PHASE_THROTTLE_SECONDS)
+            await self._throttlePhase()
 
             # --- Fundamental Research Track ---
-            if self.mode in ["fundamental", "all"]:
+            if self.mode in FUNDAMENTAL_TRACK_MODES:
                 
-                # Phase 2: Synthesis
+                # Phase 2: Synthesis + Phase 3: Clarification
                 # ------------------------------------------------------------------
-                initialSynthesis = await self.phase2_Synthesis(prunedQual, prunedQuant)
+                # Both read only the pruned Phase 1 output, so they run side by side; a failure in
+                # either cancels the other before the session tears its providers down
+                phaseResults: Dict[str, Any] = {}
+                async with anyio.create_task_group() as phaseGroup:
+                    phaseGroup.start_soon(
+                        self._collectPhaseResult, phaseResults, "synthesis", self.phase2_Synthesis, prunedQual, prunedQuant
+                    )
+                    phaseGroup.start_soon(
+                        self._collectPhaseResult, phaseResults, "clarification", self.phase3_Clarification, prunedQual, prunedQuant
+                    )
+                initialSynthesis = phaseResults["synthesis"]
+                qualClar, quantClar = phaseResults["clarification"]
                 researchStateMap["synthesis"]["initialSynthesis"] = initialSynthesis
-                await anyio.sleep(self.PHASE_THROTTLE_SECONDS)
-
-                # Phase 3: Clarification
-                # ------------------------------------------------------------------
-                qualClar, quantClar = await self.phase3_Clarification(
-                    prunedQual, 
-                    prunedQuant
-                )
                 researchStateMap["qualitative"]["clarification"] = qualClar
                 researchStateMap["quantitative"]["clarification"] = quantClar
+                await self._journalPhase(
+                    journalPath,
+                    ("Initial Synthesis", initialSynthesis),
+                    ("Qualitative Clarification", qualClar),
+                    ("Quantitative Clarification", quantClar)
+                )
                 
-                await anyio.sleep(self.PHASE_THROTTLE_SECONDS)
+                await self._throttlePhase()
 
                 # Phase 4: Final Consolidation
                 # ------------------------------------------------------------------
@@ -603,9 +953,10 @@ class ResearchOrchestrator:
                     quantAnalysis=prunedQuant
                 )
                 researchStateMap["synthesis"]["finalRecommendation"] = finalThesis
+                await self._journalPhase(journalPath, ("Final Recommendation", finalThesis))
 
             # --- Momentum Strategy Track ---
-            if self.mode in ["momentum", "all"]:
+            if self.mode in MOMENTUM_TRACK_MODES:
                 # Use pruned intelligence to minimize momentum context pressure
                 momentumThesis = await self.phase_MomentumStyling(
                     prunedQual,
@@ -614,6 +965,7 @@ class ResearchOrchestrator:
                     researchStateMap["quantitative"]["clarification"] if self.mode == "momentum" else prunedQuantClar
                 )
                 researchStateMap["momentum"]["analysis"] = momentumThesis
+                await self._journalPhase(journalPath, ("Momentum Analysis", momentumThesis))
 
             # Final Session Output
             sessionResult = {
@@ -623,33 +975,51 @@ class ResearchOrchestrator:
                 "agents": researchStateMap
             }
             
-            # Export Final Markdown Artifact
-            self.exportResearchReport(sessionResult)
+            # Export Final Markdown Artifact; the journal is superseded once the report is on disk
+            await self.exportResearchReport(sessionResult)
+            await anyio.Path(journalPath).unlink(missing_ok=True)
             return sessionResult
 
         except Exception as exc:
             logger.error(f"Research Session failed: {exc}", exc_info=True)
+            await self._reportKeptJournal(journalPath)
+            # A single failed phase in a task group surfaces wrapped; report the phase's own error
+            if isinstance(exc, ExceptionGroup) and len(exc.exceptions) == 1:
+                exc = exc.exceptions[0]
             return {"error": str(exc)}
-        finally:
-            await self.cleanup()
+
+    @staticmethod
+    async def _collectPhaseResult(phaseResults: Dict[str, Any], phaseName: str, phaseMethod, *phaseArgs):
+        """Run one phase inside a task group and store its result under phaseName."""
+        phaseResults[phaseName] = await phaseMethod(*phaseArgs)
+
+    async def _reportKeptJournal(self, journalPath: str):
+        """Point at the journal a failed session leaves behind, if any phase output reached it."""
+        if await anyio.Path(journalPath).exists():
+            logger.info(f"Partial research findings kept at {journalPath}")
+
+    async def _journalPhase(self, journalPath: str, *sections: Tuple[str, str]):
+        """Append finished phase output to the session journal so a failed session keeps its partial findings."""
+        journalText = "".join(f"## {heading}\n\n{content}\n\n" for heading, content in sections)
+        async with await anyio.open_file(journalPath, 'a', encoding='utf-8') as journal:
+            await journal.write(journalText)
 
     # --- Modular Phase Methods ---
 
+    async def _throttlePhase(self):
+        """Pause between LLM-heavy phases to stay inside provider rate envelopes; disabled when set to 0."""
+        if cfg.config.PHASE_THROTTLE_SECONDS > 0:
+            await anyio.sleep(cfg.config.PHASE_THROTTLE_SECONDS)
+
     async def phase1_ParallelAnalysis(self, query: str) -> (ResearchResult, ResearchResult):
         """Execute Phase 1: Parallel Specialized Intelligence (Qual/Quant)."""
         logger.info("PHASE 1: Execution started (Qual/Quant agents)...")
-        intelligenceSnapshots = {}
-        
-        async with anyio.create_task_group() as taskGroup:
-            async def _runQualitativeBranch():
-                intelligenceSnapshots['qual'] = await self._executeAgentTaskWithSafety(self.qualitativeAgent, query)
-            async def _runQuantitativeBranch():
-                intelligenceSnapshots['quant'] = await self._executeAgentTaskWithSafety(self.quantitativeAgent, query)
-            
-            taskGroup.start_soon(_runQualitativeBranch)
-            taskGroup.start_soon(_runQuantitativeBranch)
-            
-        return intelligenceSnapshots['qual'], intelligenceSnapshots['quant']
+        # Agent faults are already captured as ResearchResult.error by the safety wrapper
+        qualResults, quantResults = await asyncio.gather(
+            self._executeAgentTaskWithSafety(self.qualitativeAgent, query),
+            self._executeAgentTaskWithSafety(self.quantitativeAgent, query)
+        )
+        return qualResults, quantResults
 
     async def phase2_Synthesis(self, qualAnalysis: str, quantAnalysis: str) -> str:
         """Execute Phase 2: Initial Intelligence Synthesis."""
@@ -734,38 +1104,62 @@ class ResearchOrchestrator:
 
     async def _executeAgentTaskWithSafety(self, agent: Agent, task: str) -> ResearchResult:
         """Shielded agent execution with persistent error handling and structured result wrapping."""
+        dispatchedAt = datetime.now()
         try:
             analysisOutput = await self._runAgentTask(agent, task)
-            return ResearchResult(agent.profile.name, analysisOutput, datetime.now())
+            return ResearchResult(agent.profile.name, analysisOutput, dispatchedAt)
         except Exception as invocationError:
             logger.error(f"Agent [{agent.profile.name}] execution fault: {invocationError}")
-            return ResearchResult(agent.profile.name, "", datetime.now(), str(invocationError))
+            return ResearchResult(agent.profile.name, "", dispatchedAt, str(invocationError))
 
-    def exportResearchReport(self, result: Dict):
-        """Generates and writes a formatted markdown report based on the research results."""
-        creationTime = datetime.now().strftime("%Y%m%d_%H%M%S")
-        outputFilepath = self.outputDir / f"research_{result['mode']}_{creationTime}.md"
+    async def exportResearchReport(self, result: Dict):
+        """Generates and writes a formatted markdown report without blocking the event loop."""
+        creationTime = time.strftime("%Y%m%d_%H%M%S")
+        outputFilepath = os.path.join(self.outputDirStr, f"research_{result['mode']}_{creationTime}.md")
         
-        # Format core intelligence sections
-        compositeReport = cfg.MARKDOWN_REPORT_TEMPLATE.format(
-            query=result['query'],
-            qualAnalysis=result['agents']['qualitative']['analysis'],
-            qualClarification=result['agents']['qualitative']['clarification'],
-            quantAnalysis=result['agents']['quantitative']['analysis'],
-            quantClarification=result['agents']['quantitative']['clarification'],
-            finalRecommendation=result['agents'].get('synthesis', {}).get('finalRecommendation', 'N/A (Momentum-only Mode)')
-        )
+        reportBytes = self._renderResearchReport(result)
+        # Stage under a temporary name so readers (e.g. /api/papers) never see a half-written report
+        temporaryFilepath = f"{outputFilepath}.tmp"
+        try:
+            # BufferedWriter hands payloads larger than its buffer straight to the OS
+            async with await anyio.open_file(temporaryFilepath, 'wb') as artifact:
+                await artifact.write(reportBytes)
+            await anyio.to_thread.run_sync(os.replace, temporaryFilepath, outputFilepath)
+        except OSError:
+            await anyio.Path(temporaryFilepath).unlink(missing_ok=True)
+            raise
         
-        # Inject Momentum Insights if applicable
-        if result['mode'] in ['momentum', 'all']:
-            momentumIntelligence = cfg.MOMENTUM_REPORT_SECTION.format(
-                momentumAnalysis=result['agents']['momentum']['analysis']
-            )
-            compositeReport += momentumIntelligence
+        logger.info("Research artifact exported to %s", outputFilepath)
+
+    @staticmethod
+    def _renderResearchReport(result: Dict) -> bytes:
+        """Render the markdown report for a research session as UTF-8 bytes."""
+        agentStates = result['agents']
+        qualState = agentStates['qualitative']
+        quantState = agentStates['quantitative']
         
-        with open(outputFilepath, 'w', encoding='utf-8') as artifact:
-            artifact.write(compositeReport)
-        logger.info(f"Research artifact exported to {outputFilepath}")
+        # Modes on the momentum track carry the Momentum Insights section in their template
+        return _renderTemplate(
+            REPORT_TEMPLATES_BY_MODE[result['mode']],
+            query=result['query'],
+            qualAnalysis=qualState['analysis'],
+            qualClarification=qualState['clarification'],
+            quantAnalysis=quantState['analysis'],
+            quantClarification=quantState['clarification'],
+            finalRecommendation=agentStates['synthesis'].get('finalRecommendation', MOMENTUM_ONLY_RECOMMENDATION),
+            momentumAnalysis=agentStates['momentum'].get('analysis', "")
+        )
+
+
+# CLI strategy menu: choice key -> research mode
+STRATEGY_CHOICES = {"1": "fundamental", "2": "momentum", "3": "all"}
+STRATEGY_CHOICE_PROMPT = "Choice [3]: "
+STRATEGY_MENU = "\n".join((
+    "\nSelect Investigation Strategy:",
+    "1. Fundamental (Long-term strategic synthesis)",
+    "2. Momentum (Reactive swing setup identification)",
+    "3. Comprehensive (Full intelligence cycle)"
+))
 
 
 async def main():
@@ -775,26 +1169,28 @@ async def main():
         print(e)
         return
         
-    query = input(f"Enter target query [{cfg.config.DEFAULT_INVESTMENT_QUERY}]: ").strip() or cfg.config.DEFAULT_INVESTMENT_QUERY
+    # Prompts run on a worker thread so the event loop stays free while the user types
+    queryInput = await anyio.to_thread.run_sync(input, f"Enter target query [{cfg.config.DEFAULT_INVESTMENT_QUERY}]: ")
+    query = queryInput.strip() or cfg.config.DEFAULT_INVESTMENT_QUERY
     
-    print("\nSelect Investigation Strategy:")
-    print("1. Fundamental (Long-term strategic synthesis)")
-    print("2. Momentum (Reactive swing setup identification)")
-    print("3. Comprehensive (Full intelligence cycle)")
-    strategyInput = input("Choice [3]: ").strip()
+    print(STRATEGY_MENU)
+    strategyInput = (await anyio.to_thread.run_sync(input, STRATEGY_CHOICE_PROMPT)).strip()
+    selectedStrategy = STRATEGY_CHOICES.get(strategyInput, "all")
     
-    strategyMap = {"1": "fundamental", "2": "momentum", "3": "all"}
-    selectedStrategy = strategyMap.get(strategyInput, "all")
-    
-    orchestrator = ResearchOrchestrator(mode=selectedStrategy)
+    orchestrator = await ResearchOrchestrator.create(mode=selectedStrategy)
     sessionData = await orchestrator.executeResearchSession(query)
     
     if "error" not in sessionData:
-        print("\n=== INVESTIGATION COMPLETE ===")
-        print(f"Strategy: {sessionData['mode']} | Artifact: output/research_...")
+        print(f"\n=== INVESTIGATION COMPLETE ===\nStrategy: {sessionData['mode']} | Artifact: output/research_...")
     else:
         print(f"\nInvestigation Fault: {sessionData['error']}")
 
+def _eventLoopOptions() -> Dict:
+    """Run on uvloop when it is installed; Windows and minimal installs fall back to the stdlib loop."""
+    if importlib.util.find_spec("uvloop") is None:
+        return {}
+    return {"use_uvloop": True}
+
 if __name__ == "__main__":
-    anyio.run(main)
+    anyio.run(main, backend="asyncio", backend_options=_eventLoopOptions())
 
@@ -1,76 +1,128 @@
-# ABOUTME: Stateless utility for pruning LLM agent outputs before inter-agent handoffs.
+# ABOUTME: Utility for pruning LLM agent outputs before inter-agent handoffs, with a bounded result cache.
 # ABOUTME: Strips thinking preambles, workflow markers, and excessive decorative bloat.
 
 import re
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Tuple
 
 logger = logging.getLogger("OutputPruner")
 
-def pruneAgentOutput(rawOutput: str, maxChars: int = 0, agentType: str = "general") -> str:
-    """
-    Cleans raw agent output for context efficiency.
-    Target: Remove 'thinking' noise while preserving substantive findings/data.
-    """
-    if not rawOutput:
-        return ""
-
-    lines = rawOutput.splitlines()
-    pruned_lines = []
-    
-    # Heuristic patterns for thinking preamble and internal noise
-    # We avoid complex regex to prevent false positives on substantive headers
-    preamble_patterns = [
-        "i'll conduct", "i'll start by", "i'll follow", "i'll use",
-        "let me analyze", "let me check", "let me start", "let me look",
-        "i need to", "i will", "here's my approach", "here is my approach",
-        "i'm thinking", "i am thinking", "first, i'll", "first, i will"
-    ]
-    
-    workflow_patterns = [
-        "## phase", "## step", "### phase", "### step"
-    ]
-    
-    # Standalone separator: a line that is ONLY dashes (e.g. "---", "-----")
-    separator_re = re.compile(r'^-{2,}$')
-
+# Heuristic patterns for thinking preamble and internal noise
+# Literal prefixes only (no free-form regex) to prevent false positives on substantive headers
+PREAMBLE_PREFIXES = (
+    "i'll conduct", "i'll start by", "i'll follow", "i'll use",
+    "let me analyze", "let me check", "let me start", "let me look",
+    "i need to", "i will", "here's my approach", "here is my approach",
+    "i'm thinking", "i am thinking", "first, i'll", "first, i will"
+)
+
+WORKFLOW_PREFIXES = (
+    "## phase", "## step", "### phase", "### step"
+)
+
+# Patterns are compiled once at import and shared by every inter-agent handoff
+# Case-insensitive prefix alternations match the original line, so no lowered copy is needed
+PREAMBLE_PATTERN = re.compile("|".join(map(re.escape, PREAMBLE_PREFIXES)), re.IGNORECASE)
+WORKFLOW_PATTERN = re.compile("|".join(map(re.escape, WORKFLOW_PREFIXES)), re.IGNORECASE)
+# Standalone separator: a left-stripped line that is ONLY dashes (e.g. "---", "-----")
+SEPARATOR_LINE_PATTERN = re.compile(r'-{2,}\s*\Z')
+# Runs collapsed after line filtering
+BLANK_LINE_RUN_PATTERN = re.compile(r'\n{3,}')
+DASH_RUN_PATTERN = re.compile(r'-{5,}')
+
+# Pruned results remembered per process, keyed by (content fingerprint, maxChars)
+PRUNE_CACHE_SIZE = 256
+# Below this size pruning is cheaper than hashing and bookkeeping, so the cache is bypassed
+PRUNE_CACHE_MIN_CHARS = 2048
+_prunedOutputs: "OrderedDict[Tuple[bytes, int], str]" = OrderedDict()
+_pruneCacheStats: Dict[str, int] = {"hits": 0, "misses": 0}
+# pruneAgentOutput may be called from any thread, so cache reads and writes hold this lock
+_pruneCacheLock = threading.Lock()
+
+def _iterPrunedLines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the lines that survive the preamble, workflow-marker and separator filters."""
     for line in lines:
-        stripped = line.strip().lower()
-        if not stripped:
-            pruned_lines.append(line)
+        # One left-strip per line; trailing whitespace is only trimmed when a length check needs it
+        lstripped = line.lstrip()
+        if not lstripped:
+            yield line
             continue
             
         # 1. Strip thinking preamble (case-insensitive start-of-line matches)
-        is_preamble = any(stripped.startswith(p) for p in preamble_patterns)
-        if is_preamble and len(stripped) < 200: # Avoid stripping long substantive paragraphs
+        is_preamble = PREAMBLE_PATTERN.match(lstripped)
+        if is_preamble and len(lstripped.rstrip()) < 200: # Avoid stripping long substantive paragraphs
             continue
             
         # 2. Strip workflow metadata (headers that are just markers)
         # We only strip if the line is JUST the marker (e.g. "## Phase 1:")
-        is_workflow = any(stripped.startswith(p) for p in workflow_patterns)
-        if is_workflow and (":" in stripped or len(stripped) < 15):
+        is_workflow = WORKFLOW_PATTERN.match(lstripped)
+        if is_workflow and (":" in lstripped or len(lstripped.rstrip()) < 15):
             continue
 
         # 3. Strip standalone separator lines (e.g. "---", "-----")
-        if separator_re.match(stripped):
+        if SEPARATOR_LINE_PATTERN.match(lstripped):
             continue
 
-        pruned_lines.append(line)
+        yield line
 
-    # Convert back to string
-    content = "\n".join(pruned_lines)
+def pruneAgentOutput(rawOutput: str, maxChars: int = 0, agentType: str = "general") -> str:
+    """
+    Cleans raw agent output for context efficiency.
+    Target: Remove 'thinking' noise while preserving substantive findings/data.
+    """
+    if not rawOutput:
+        return ""
+    if len(rawOutput) < PRUNE_CACHE_MIN_CHARS:
+        return _pruneUncached(rawOutput, maxChars)
+
+    # The same handoff text is often pruned again (e.g. recursive clarification, repeated sessions)
+    cacheKey = (hashlib.blake2b(rawOutput.encode('utf-8', 'surrogatepass'), digest_size=16).digest(), maxChars)
+    with _pruneCacheLock:
+        prunedOutput = _prunedOutputs.get(cacheKey)
+        if prunedOutput is not None:
+            _prunedOutputs.move_to_end(cacheKey)
+            _pruneCacheStats["hits"] += 1
+            logger.debug(f"Prune cache hit ({_pruneCacheStats['hits']} hits / {_pruneCacheStats['misses']} misses)")
+            return prunedOutput
+        _pruneCacheStats["misses"] += 1
+
+    # The pruning itself runs outside the lock; a concurrent miss on the same text stores an identical result
+    prunedOutput = _pruneUncached(rawOutput, maxChars)
+    with _pruneCacheLock:
+        _prunedOutputs[cacheKey] = prunedOutput
+        _prunedOutputs.move_to_end(cacheKey)
+        if len(_prunedOutputs) > PRUNE_CACHE_SIZE:
+            _prunedOutputs.popitem(last=False)
+    return prunedOutput
+
+def _pruneUncached(rawOutput: str, maxChars: int) -> str:
+    """Run the full filter, collapse and truncation pipeline on a non-empty output."""
+    # Filter lines and convert back to string
+    content = "\n".join(_iterPrunedLines(rawOutput.splitlines()))
 
     # 3. Collapse whitespace and decorative separators
+    # Each substitution runs only when its substring guard finds a run to collapse
     # Collapse 3+ newlines to 2
-    content = re.sub(r'\n{3,}', '\n\n', content)
+    if '\n\n\n' in content:
+        content = BLANK_LINE_RUN_PATTERN.sub('\n\n', content)
     
     # Balance separators: Reduce excessive --- runs (e.g. 10 dashes to 3)
     # This preserves structure but reduces character bloat
-    content = re.sub(r'-{5,}', '---', content)
+    if '-----' in content:
+        content = DASH_RUN_PATTERN.sub('---', content)
 
     # 4. Optional Truncation (Preserve head and tail)
     if maxChars > 0 and len(content) > maxChars:
         half = maxChars // 2
-        content = content[:half] + f"\n\n[... {len(content) - maxChars} chars truncated for context efficiency ...]\n\n" + content[-half:]
+        # Head, truncation marker and tail are joined in a single allocation
+        content = "".join((
+            content[:half],
+            f"\n\n[... {len(content) - maxChars} chars truncated for context efficiency ...]\n\n",
+            content[-half:],
+        ))
 
     return content.strip()
 
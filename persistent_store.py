@@ -0,0 +1,66 @@
+# ABOUTME: SQLite-backed key/value store with a time-to-live, shared by the cross-session caches.
+# ABOUTME: Each cache names its own table; blocking database calls run on worker threads.
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import anyio
+
+
+class PersistentKeyValueStore:
+    """String key/value table in a SQLite file whose entries expire after ttlSeconds."""
+
+    def __init__(self, databasePath: Path, tableName: str, ttlSeconds: int):
+        # The table name is interpolated into SQL, so only plain identifiers are accepted
+        if not tableName.isidentifier():
+            raise ValueError(f"Invalid table name for persistent store: {tableName!r}")
+        self.databasePath = databasePath
+        self.tableName = tableName
+        self.ttlSeconds = ttlSeconds
+        self.connection: Optional[sqlite3.Connection] = None
+        # Worker threads share one connection; sqlite3 objects are not safe for concurrent use
+        self.connectionLock = threading.Lock()
+
+    def _ensureConnection(self) -> sqlite3.Connection:
+        if self.connection is None:
+            self.connection = sqlite3.connect(str(self.databasePath), isolation_level=None, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.tableName} (key TEXT PRIMARY KEY, response TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+        return self.connection
+
+    def _read(self, key: str) -> Optional[str]:
+        with self.connectionLock:
+            row = self._ensureConnection().execute(
+                f"SELECT response, ts FROM {self.tableName} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttlSeconds:
+            return None
+        return row[0]
+
+    def _write(self, key: str, value: str):
+        with self.connectionLock:
+            self._ensureConnection().execute(
+                f"INSERT OR REPLACE INTO {self.tableName} (key, response, ts) VALUES (?, ?, ?)",
+                (key, value, int(time.time()))
+            )
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return a stored value younger than the TTL, or None."""
+        return await anyio.to_thread.run_sync(self._read, key)
+
+    async def put(self, key: str, value: str):
+        """Store a value, replacing any earlier one under the same key."""
+        await anyio.to_thread.run_sync(self._write, key, value)
+
+    def close(self):
+        """Release the database handle; the next access reopens it."""
+        with self.connectionLock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
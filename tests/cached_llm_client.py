@@ -0,0 +1,48 @@
+# ABOUTME: Test-only ILlmClient wrapper that replays stored chat completions for identical requests.
+# ABOUTME: Lets integration reruns skip the model when LLM_CACHE_TTL_SECONDS is set in the test settings.
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional
+
+from llm_client import ILlmClient
+from persistent_store import PersistentKeyValueStore
+
+logger = logging.getLogger(__name__)
+
+
+class CachedLlmClient(ILlmClient):
+    """Wraps a chat client so reruns with identical requests replay stored completions."""
+    
+    def __init__(self, innerClient: ILlmClient, responseCache: PersistentKeyValueStore):
+        self.innerClient = innerClient
+        self.responseCache = responseCache
+    
+    def _requestCacheKey(self, model: str, messages: List[Dict], tools: Optional[List[Dict]]) -> str:
+        """Fingerprint the request; sampling settings live on the wrapped client, so they are part of its identity."""
+        request = {
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "temperature": getattr(self.innerClient, "temperature", None),
+            "max_tokens": getattr(self.innerClient, "maxTokens", None),
+        }
+        encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode('utf-8', 'surrogatepass')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    async def chatCompletion(self, model: str, messages: List[Dict], tools: Optional[List[Dict]] = None) -> Dict:
+        """Replay a stored completion for an identical request; otherwise ask the wrapped client and store its answer."""
+        cacheKey = self._requestCacheKey(model, messages, tools)
+        cachedResponse = await self.responseCache.get(cacheKey)
+        if cachedResponse is not None:
+            logger.info(f"Chat completion cache hit for {model}")
+            return json.loads(cachedResponse)
+        
+        response = await self.innerClient.chatCompletion(model, messages, tools)
+        await self.responseCache.put(cacheKey, json.dumps(response))
+        return response
+    
+    async def aclose(self):
+        """Close the response store and the wrapped client."""
+        self.responseCache.close()
+        await self.innerClient.aclose()
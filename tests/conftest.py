@@ -0,0 +1,20 @@
+# ABOUTME: Pytest configuration shared by the unit test modules under tests/.
+# ABOUTME: Puts the project root on sys.path and leaves the Docker-backed integration script out of collection.
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+# The integration script needs live MCP containers and a local LLM: run it with `python tests/test_mock_workflow.py`
+# test_model_config.py holds settings, not tests
+collect_ignore = ["test_mock_workflow.py", "test_model_config.py"]
+
+
+@pytest.fixture
+def anyio_backend():
+    # The agents use asyncio primitives (gather, Semaphore, Future) directly
+    return "asyncio"
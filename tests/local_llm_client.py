@@ -3,11 +3,13 @@ import json
 import re
 import logging
 import uuid
-from typing import List, Dict, Optional, Tuple
+import importlib.util
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
 
 import httpx
-from tests.test_model_config import settings
+from tests.test_model_config import getSettings
+from llm_client import ILlmClient
 from openai import OpenAI
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,10 @@ logger = logging.getLogger(__name__)
 # Enable httpx logging for LLM requests (matches embedding_provider behavior)
 logging.getLogger("httpx").setLevel(logging.INFO)
 
+# Connections are pooled across extraction calls; HTTP/2 is negotiated when the h2 extra is installed
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32)
+
 
 # Result Dataclass
 @dataclass
@@ -32,17 +38,33 @@ class LocalLLMClient:
     
     def __init__(self, baseUrl: Optional[str] = None, model: Optional[str] = None):
         # Initialize LLM client with optional baseUrl and model name.
+        settings = getSettings()
         self.baseUrl = baseUrl or settings.LLM_URL
         self.model = model or settings.LLM_MODEL
         self.temperature = settings.LLM_TEMPERATURE
         self.maxTokens = settings.LLM_MAX_TOKENS
         self.maxEntities = settings.MAX_ENTITIES_PER_CHUNK
         self.maxRelationships = settings.MAX_RELATIONSHIPS_PER_CHUNK
+        self.httpClient: Optional[httpx.AsyncClient] = None
         
         logger.info(f"LLM client initialized: {self.baseUrl} using {self.model}")
     
-    def _callLLM(self, prompt: str, taskDescription: str = "LLM request") -> Tuple[str, Optional[str]]:
+    def _getHttpClient(self) -> httpx.AsyncClient:
+        # Open the pooled client on first use; later calls reuse its connections.
+        if self.httpClient is None:
+            self.httpClient = httpx.AsyncClient(timeout=600.0, http2=HTTP2_ENABLED, limits=CLIENT_LIMITS)
+        return self.httpClient
+    
+    async def aclose(self):
+        # Release pooled connections; the next request opens a fresh client.
+        if self.httpClient is not None:
+            httpClient, self.httpClient = self.httpClient, None
+            await httpClient.aclose()
+    
+    async def _callLLM(self, prompt: str, taskDescription: str = "LLM request") -> Tuple[str, Optional[str]]:
         # Make a chat completion request to the LLM. Returns (response_text, error_message).
+        # Awaits the request so concurrent extraction tasks share the event loop instead of blocking it.
+        settings = getSettings()
         # Docker Model Runner uses OpenAI-compatible /v1/chat/completions endpoint
         endpoint = f"{self.baseUrl}/v1/chat/completions"
         
@@ -57,21 +79,21 @@ class LocalLLMClient:
             "num_ctx": settings.LLM_CONTEXT_LENGTH  # Explicit context window for llama.cpp
         }
         
-        # Diagnostic logging: estimate token count (rough: 4 chars per token)
-        systemPromptLen = len(settings.LLM_SYSTEM_PROMPT)
-        promptLen = len(prompt)
-        estimatedInputTokens = (systemPromptLen + promptLen) // 4
-        logger.debug(f"LLM request: ~{estimatedInputTokens} input tokens, max_tokens={self.maxTokens}, num_ctx={settings.LLM_CONTEXT_LENGTH}")
+        # Diagnostic logging: estimate token count (rough: 4 chars per token), only when it will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            systemPromptLen = len(settings.LLM_SYSTEM_PROMPT)
+            promptLen = len(prompt)
+            estimatedInputTokens = (systemPromptLen + promptLen) // 4
+            logger.debug(f"LLM request: ~{estimatedInputTokens} input tokens, max_tokens={self.maxTokens}, num_ctx={settings.LLM_CONTEXT_LENGTH}")
         
         try:
-            with httpx.Client(timeout=600.0) as client:
-                response = client.post(endpoint, json=payload)
-                response.raise_for_status()
-                
-                data = response.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                
-                return content, None
+            response = await self._getHttpClient().post(endpoint, json=payload)
+            response.raise_for_status()
+            
+            data = response.json()
+            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+            
+            return content, None
                 
         except httpx.TimeoutException:
             error = f"LLM request timed out after 600s"
@@ -90,9 +112,10 @@ class LocalLLMClient:
             logger.error(f"[ERROR] {error}. Prompt snippet: {prompt[:500]}...")
             return "", error
 
-def getLLMClient(baseUrl: Optional[str] = None, model: Optional[str] = None) -> LocalLLMClient:
+def getLLMClient(baseUrl: Optional[str] = None, model: Optional[str] = None) -> Union[LocalLLMClient, ILlmClient]:
     # Factory for general LLM client (entities, summarization, pruning).
-    provider = settings.RELATIONSHIP_PROVIDER
+    # Each call builds a fresh client bound to the caller's event loop; close it with aclose() when the run ends.
+    provider = getSettings().RELATIONSHIP_PROVIDER
     
     if provider == "openrouter":
         from llm_client import OpenRouterClient # Late import to avoid cycles or missing imports
@@ -0,0 +1,162 @@
+# ABOUTME: Unit tests for Agent.performResearchTask's tool-calling loop against a scripted LLM client.
+# ABOUTME: Covers repeated-call reuse, retries of failed calls, tool_call_id pairing and trimming of old tool results.
+import json
+
+import pytest
+
+import internal_configs as cfg
+from llm_client import ILlmClient
+from multi_agent_investment import TRIMMED_TOOL_RESULT, Agent, AgentProfile
+
+
+class _ScriptedLlmClient(ILlmClient):
+    """Returns the queued assistant messages in order and records the history sent with each request."""
+
+    def __init__(self, *assistantMessages):
+        self.assistantMessages = list(assistantMessages)
+        self.sentHistories = []
+
+    async def chatCompletion(self, model, messages, tools=None):
+        self.sentHistories.append([dict(message) for message in messages])
+        return {"choices": [{"message": self.assistantMessages.pop(0)}]}
+
+
+def _toolTurn(*calls):
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {"id": callId, "type": "function", "function": {"name": name, "arguments": arguments}}
+            for callId, name, arguments in calls
+        ]
+    }
+
+
+def _finalTurn(content="Final report"):
+    return {"role": "assistant", "content": content}
+
+
+def _agent(llmClient, dispatchedCalls, resultSize=20) -> Agent:
+    profile = AgentProfile(name="Test Agent", skills=[], personality=[], specialization="testing", fullSpec="spec")
+    agent = Agent(profile, llmClient)
+
+    async def _dispatch(targetToolName, toolArguments):
+        dispatchedCalls.append((targetToolName, toolArguments))
+        return f"{targetToolName}:{json.dumps(toolArguments, sort_keys=True)}".ljust(resultSize, ".")
+
+    agent._dispatchToolCall = _dispatch
+    return agent
+
+
+def _toolMessages(history):
+    return [message for message in history if message["role"] == "tool"]
+
+
+@pytest.mark.anyio
+async def test_repeated_tool_calls_are_dispatched_once():
+    llmClient = _ScriptedLlmClient(
+        _toolTurn(
+            ("call_1", "getQuote", '{"symbol": "RKLB", "range": "1d"}'),
+            ("call_2", "getQuote", '{"range":"1d","symbol":"RKLB"}'),
+            ("call_3", "getNews", '{"symbol": "RKLB"}')
+        ),
+        _toolTurn(("call_4", "getQuote", '{"symbol": "RKLB", "range": "1d"}')),
+        _finalTurn()
+    )
+    dispatchedCalls = []
+
+    result = await _agent(llmClient, dispatchedCalls).performResearchTask("Research RKLB")
+
+    assert result == "Final report"
+    assert dispatchedCalls == [
+        ("getQuote", {"symbol": "RKLB", "range": "1d"}),
+        ("getNews", {"symbol": "RKLB"})
+    ]
+    toolMessages = _toolMessages(llmClient.sentHistories[-1])
+    assert toolMessages[0]["content"] == toolMessages[1]["content"] == toolMessages[3]["content"]
+    assert toolMessages[2]["content"].startswith("getNews:")
+
+
+@pytest.mark.anyio
+async def test_failed_tool_call_runs_again_when_retried():
+    llmClient = _ScriptedLlmClient(
+        _toolTurn(("call_1", "getQuote", '{"symbol": "RKLB"}')),
+        _toolTurn(("call_2", "getQuote", '{"symbol": "RKLB"}')),
+        _toolTurn(("call_3", "getQuote", '{"symbol": "RKLB"}')),
+        _finalTurn()
+    )
+    dispatchedCalls = []
+    agent = _agent(llmClient, dispatchedCalls)
+    succeedingDispatch = agent._dispatchToolCall
+
+    async def _timeOutFirst(targetToolName, toolArguments):
+        if not dispatchedCalls:
+            dispatchedCalls.append((targetToolName, toolArguments))
+            return "Error: MCP request timed out"
+        return await succeedingDispatch(targetToolName, toolArguments)
+
+    agent._dispatchToolCall = _timeOutFirst
+
+    await agent.performResearchTask("Research RKLB")
+
+    # The timed-out call is retried once; the successful retry is then reused
+    assert len(dispatchedCalls) == 2
+    toolMessages = _toolMessages(llmClient.sentHistories[-1])
+    assert toolMessages[0]["content"] == "Error: MCP request timed out"
+    assert toolMessages[1]["content"] == toolMessages[2]["content"]
+    assert toolMessages[1]["content"].startswith("getQuote:")
+
+
+@pytest.mark.anyio
+async def test_every_tool_call_id_gets_a_tool_message_in_request_order():
+    llmClient = _ScriptedLlmClient(
+        _toolTurn(
+            ("call_a", "getQuote", '{"symbol": "RKLB"}'),
+            ("call_b", "getQuote", '{"symbol": "RKLB"}'),
+            ("call_c", "getNews", '{"symbol": "ASTS"}')
+        ),
+        _finalTurn()
+    )
+
+    await _agent(llmClient, []).performResearchTask("Research RKLB")
+
+    finalHistory = llmClient.sentHistories[-1]
+    assistantIndex = next(index for index, message in enumerate(finalHistory) if message.get("tool_calls"))
+    requestedIds = [call["id"] for call in finalHistory[assistantIndex]["tool_calls"]]
+    followingMessages = finalHistory[assistantIndex + 1:]
+    assert [message["tool_call_id"] for message in followingMessages] == requestedIds
+    assert [message["name"] for message in followingMessages] == ["getQuote", "getQuote", "getNews"]
+
+
+@pytest.mark.anyio
+async def test_trimming_elides_old_results_but_keeps_pairing_and_newest_turn(monkeypatch):
+    monkeypatch.setattr(cfg.config, "CONTEXT_TRIM_CHARS", 1000)
+    llmClient = _ScriptedLlmClient(
+        _toolTurn(("call_1", "getQuote", '{"symbol": "RKLB"}')),
+        _toolTurn(("call_2", "getQuote", '{"symbol": "ASTS"}')),
+        _toolTurn(("call_3", "getQuote", '{"symbol": "LUNR"}'), ("call_4", "getNews", '{"symbol": "LUNR"}')),
+        _finalTurn()
+    )
+
+    await _agent(llmClient, [], resultSize=400).performResearchTask("Research space stocks")
+
+    toolMessages = _toolMessages(llmClient.sentHistories[-1])
+    assert [message["tool_call_id"] for message in toolMessages] == ["call_1", "call_2", "call_3", "call_4"]
+    assert [message["content"] for message in toolMessages[:2]] == [TRIMMED_TOOL_RESULT] * 2
+    assert all(len(message["content"]) == 400 for message in toolMessages[2:])
+
+
+def test_trim_stops_once_history_fits_budget(monkeypatch):
+    monkeypatch.setattr(cfg.config, "CONTEXT_TRIM_CHARS", 2500)
+    history = [
+        {"role": "system", "content": "spec"},
+        {"role": "tool", "tool_call_id": "call_1", "content": "x" * 1000},
+        {"role": "tool", "tool_call_id": "call_2", "content": "y" * 1000},
+        {"role": "tool", "tool_call_id": "call_3", "content": "z" * 1000}
+    ]
+
+    historyChars = Agent._trimToolHistory(history, 3004, latestTurnStart=3)
+
+    assert history[1]["content"] == TRIMMED_TOOL_RESULT
+    assert history[2]["content"] == "y" * 1000
+    assert historyChars == 3004 - 1000 + len(TRIMMED_TOOL_RESULT)
@@ -0,0 +1,56 @@
+# ABOUTME: Unit tests for the test-suite CachedLlmClient completion replay wrapper.
+# ABOUTME: Checks that identical requests are replayed and changed requests reach the wrapped client.
+import pytest
+
+from llm_client import ILlmClient
+from persistent_store import PersistentKeyValueStore
+from tests.cached_llm_client import CachedLlmClient
+
+
+class _CountingLlmClient(ILlmClient):
+    """Answers every request with a fresh completion and counts how many reached it."""
+
+    def __init__(self, temperature: float = 0.1):
+        self.temperature = temperature
+        self.maxTokens = 256
+        self.requests = []
+
+    async def chatCompletion(self, model, messages, tools=None):
+        self.requests.append(messages)
+        return {"choices": [{"message": {"role": "assistant", "content": f"answer {len(self.requests)}"}}]}
+
+
+@pytest.fixture
+def completionStore(tmp_path):
+    store = PersistentKeyValueStore(tmp_path / "llm_cache.sqlite", tableName="chat_completions", ttlSeconds=60)
+    yield store
+    store.close()
+
+
+@pytest.mark.anyio
+async def test_identical_request_is_replayed_without_reaching_inner_client(completionStore):
+    innerClient = _CountingLlmClient()
+    client = CachedLlmClient(innerClient, completionStore)
+    messages = [{"role": "user", "content": "Summarize RKLB"}]
+
+    firstResponse = await client.chatCompletion("test-model", messages)
+    replayedResponse = await client.chatCompletion("test-model", [dict(message) for message in messages])
+
+    assert replayedResponse == firstResponse
+    assert len(innerClient.requests) == 1
+
+
+@pytest.mark.anyio
+async def test_changed_request_or_sampling_settings_miss_the_cache(completionStore):
+    innerClient = _CountingLlmClient()
+    messages = [{"role": "user", "content": "Summarize RKLB"}]
+
+    await CachedLlmClient(innerClient, completionStore).chatCompletion("test-model", messages)
+    await CachedLlmClient(innerClient, completionStore).chatCompletion("other-model", messages)
+    await CachedLlmClient(innerClient, completionStore).chatCompletion(
+        "test-model", messages, tools=[{"type": "function", "function": {"name": "get_quote"}}]
+    )
+    innerClient.temperature = 0.7
+    await CachedLlmClient(innerClient, completionStore).chatCompletion("test-model", messages)
+
+    assert len(innerClient.requests) == 4
@@ -0,0 +1,215 @@
+# ABOUTME: Unit tests for the OpenRouter transport helpers in llm_client.
+# ABOUTME: Covers SSE stream reassembly, rate-limit handling and prompt-cache breakpoints without touching the network.
+import asyncio
+import copy
+import json
+from types import SimpleNamespace
+
+import anyio
+import httpx
+import pytest
+
+import llm_client
+from llm_client import OpenRouterClient, _collectStreamedCompletion, _withCacheBreakpoint
+
+
+def _sseResponse(*events) -> httpx.Response:
+    """Build a response whose body is an SSE stream; dicts become data events, strings are sent verbatim."""
+    lines = []
+    for event in events:
+        lines.append(event if isinstance(event, str) else f"data: {json.dumps(event)}")
+        lines.append("\n\n")
+    return httpx.Response(200, content="".join(lines).encode("utf-8"))
+
+
+@pytest.mark.anyio
+async def test_streamed_tool_call_matches_non_streamed_shape():
+    response = _sseResponse(
+        ": OPENROUTER PROCESSING",
+        {"choices": [{"index": 0, "delta": {"role": "assistant", "content": "Checking "}}]},
+        {"choices": [{"index": 0, "delta": {"content": "prices."}}]},
+        {"choices": [{"index": 0, "delta": {"tool_calls": [
+            {"index": 0, "id": "call_1", "type": "function", "function": {"name": "get_quote", "arguments": '{"tic'}}
+        ]}}]},
+        {"choices": [{"index": 0, "delta": {"tool_calls": [
+            {"index": 0, "function": {"arguments": 'ker": "UUUU"}'}}
+        ]}}]},
+        {"choices": [{"index": 0, "delta": {}, "finish_reason": "tool_calls"}]},
+        {"choices": [], "usage": {"prompt_tokens": 12, "completion_tokens": 7, "total_tokens": 19}},
+        "data: [DONE]",
+    )
+
+    completion = await _collectStreamedCompletion(response)
+
+    assert completion == {
+        "choices": [{
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": "Checking prices.",
+                "tool_calls": [{
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "get_quote", "arguments": '{"ticker": "UUUU"}'},
+                }],
+            },
+            "finish_reason": "tool_calls",
+        }],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 7, "total_tokens": 19},
+    }
+    assert json.loads(completion["choices"][0]["message"]["tool_calls"][0]["function"]["arguments"]) == {"ticker": "UUUU"}
+
+
+@pytest.mark.anyio
+async def test_streamed_parallel_tool_calls_keep_index_order():
+    response = _sseResponse(
+        {"choices": [{"index": 0, "delta": {"tool_calls": [
+            {"index": 1, "id": "call_b", "function": {"name": "second", "arguments": "{}"}},
+            {"index": 0, "id": "call_a", "function": {"name": "first", "arguments": "{}"}},
+        ]}}]},
+        "data: [DONE]",
+    )
+
+    completion = await _collectStreamedCompletion(response)
+
+    message = completion["choices"][0]["message"]
+    assert message["content"] is None
+    assert [call["id"] for call in message["tool_calls"]] == ["call_a", "call_b"]
+    assert "usage" not in completion
+
+
+@pytest.mark.anyio
+async def test_stream_error_event_raises():
+    response = _sseResponse({"error": {"message": "upstream overloaded"}})
+
+    with pytest.raises(RuntimeError, match="upstream overloaded"):
+        await _collectStreamedCompletion(response)
+
+
+def _openRouterClient(handler, maxRetries: int, maxConcurrency: int = 4) -> OpenRouterClient:
+    """OpenRouterClient whose borrowed HTTP client answers every request with the given handler."""
+    httpClient = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return OpenRouterClient(
+        apiKey="test-key",
+        baseUrl="https://openrouter.test/chat",
+        maxRetries=maxRetries,
+        maxConcurrency=maxConcurrency,
+        httpClient=httpClient
+    )
+
+
+@pytest.fixture
+def fakeClock(monkeypatch):
+    """Drive llm_client's monotonic clock by hand; each sleep yields, then moves the clock to its wake-up time."""
+    clock = SimpleNamespace(now=0.0, sleeps=[])
+
+    async def _sleep(seconds):
+        clock.sleeps.append(seconds)
+        wakeAt = clock.now + seconds
+        await asyncio.sleep(0)
+        clock.now = max(clock.now, wakeAt)
+
+    monkeypatch.setattr(llm_client, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(anyio, "sleep", _sleep)
+    return clock
+
+
+@pytest.mark.anyio
+async def test_final_rate_limit_raises_without_backoff(fakeClock):
+    requestCount = 0
+
+    def _rateLimited(request):
+        nonlocal requestCount
+        requestCount += 1
+        return httpx.Response(429, headers={"Retry-After": "30"})
+
+    client = _openRouterClient(_rateLimited, maxRetries=2)
+
+    with pytest.raises(RuntimeError, match="after 2 attempts"):
+        await client.chatCompletion("test-model", [{"role": "user", "content": "hi"}])
+
+    assert requestCount == 2
+    # Only the first 429 schedules a wait; the final one fails immediately
+    assert fakeClock.sleeps == [30.0]
+
+
+@pytest.mark.anyio
+async def test_concurrent_callers_wait_out_one_retry_after(fakeClock):
+    requestTimes = []
+
+    async def _rateLimitedOnce(request):
+        requestTimes.append(fakeClock.now)
+        # Let the other caller queue for the request slot while this request is in flight
+        await asyncio.sleep(0)
+        if len(requestTimes) == 1:
+            return httpx.Response(429, headers={"Retry-After": "30"})
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]})
+
+    client = _openRouterClient(_rateLimitedOnce, maxRetries=3, maxConcurrency=1)
+    messages = [{"role": "user", "content": "hi"}]
+
+    results = await asyncio.gather(
+        client.chatCompletion("test-model", messages),
+        client.chatCompletion("test-model", messages)
+    )
+
+    assert [result["choices"][0]["message"]["content"] for result in results] == ["ok", "ok"]
+    # One 429, then neither caller sends again until the shared Retry-After has elapsed
+    assert requestTimes == [0.0, 30.0, 30.0]
+    assert fakeClock.sleeps == [30.0, 30.0]
+
+
+TOOL_ROUND_HISTORY = [
+    {"role": "system", "content": "You are a research agent."},
+    {"role": "user", "content": "Research RKLB"},
+    {"role": "assistant", "content": None, "tool_calls": [
+        {"id": "call_1", "type": "function", "function": {"name": "get_quote", "arguments": "{}"}}
+    ]},
+    {"role": "tool", "tool_call_id": "call_1", "name": "get_quote", "content": "RKLB 21.40"},
+    {"role": "user", "content": [{"type": "image_url", "image_url": {"url": "https://example.test/chart.png"}}]},
+]
+
+
+def test_cache_breakpoint_marks_only_latest_plain_text_user_turn():
+    originalHistory = copy.deepcopy(TOOL_ROUND_HISTORY)
+
+    markedHistory = _withCacheBreakpoint(TOOL_ROUND_HISTORY)
+
+    assert TOOL_ROUND_HISTORY == originalHistory
+    assert markedHistory[1] == {
+        "role": "user",
+        "content": [{"type": "text", "text": "Research RKLB", "cache_control": {"type": "ephemeral"}}]
+    }
+    # Every other turn is passed through untouched
+    unchangedIndexes = [0, 2, 3, 4]
+    assert all(markedHistory[index] is TOOL_ROUND_HISTORY[index] for index in unchangedIndexes)
+    assert sum("cache_control" in json.dumps(message) for message in markedHistory) == 1
+
+
+def test_cache_breakpoint_leaves_history_without_text_user_turn_alone():
+    history = [TOOL_ROUND_HISTORY[0], TOOL_ROUND_HISTORY[4]]
+
+    assert _withCacheBreakpoint(history) is history
+
+
+@pytest.mark.anyio
+async def test_prompt_caching_marks_request_body_but_not_caller_history():
+    sentBodies = []
+
+    def _recordRequest(request):
+        sentBodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]})
+
+    client = OpenRouterClient(
+        apiKey="test-key",
+        baseUrl="https://openrouter.test/chat",
+        promptCaching=True,
+        httpClient=httpx.AsyncClient(transport=httpx.MockTransport(_recordRequest))
+    )
+    history = copy.deepcopy(TOOL_ROUND_HISTORY[:4])
+
+    await client.chatCompletion("test-model", history)
+
+    assert history == TOOL_ROUND_HISTORY[:4]
+    assert sentBodies[0]["messages"][1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert sentBodies[0]["messages"][0] == TOOL_ROUND_HISTORY[0]
@@ -17,6 +17,7 @@ import json
 import asyncio
 import sys
 import logging
+import anyio
 from datetime import datetime
 from pathlib import Path
 
@@ -31,10 +32,13 @@ from multi_agent_investment import (
     McpToolProvider, 
     WebSearchAgent, 
     InternalAgentAdapter, 
-    AgentSpecLoader
+    AgentSpecLoader,
+    _eventLoopOptions
 )
 from llm_client import LocalLlmClient
-from tests.test_model_config import settings
+from persistent_store import PersistentKeyValueStore
+from tests.cached_llm_client import CachedLlmClient
+from tests.test_model_config import getSettings
 from tests.crawl4ai_agent import Crawl4AiAgent
 from mcp import StdioServerParameters
 
@@ -49,13 +53,14 @@ async def test_integration_workflow():
     Agent B: Uses Crawl4AI for web content extraction
     Agent C: Synthesizes A and B
     """
+    settings = getSettings()
     
     # 1. Load Agent Profiles
     agents_dir = Path(__file__).parent / "agent-defs"
     
     def load_profile(filename):
-        with open(agents_dir / filename, 'r') as f:
-            return AgentSpecLoader.loadFromMarkdown(f.read())
+        # Cached per file and modification time, so reruns in one process skip the read and parse
+        return AgentSpecLoader.loadFromPath(agents_dir / filename)
 
     profile_a = load_profile("test_specialist.md")
     profile_b = load_profile("test_researcher.md")
@@ -69,6 +74,12 @@ async def test_integration_workflow():
         temperature=settings.LLM_TEMPERATURE,
         maxTokens=settings.LLM_MAX_TOKENS
     )
+    # Reruns replay identical completions from disk when LLM_CACHE_TTL_SECONDS is set
+    if settings.LLM_CACHE_TTL_SECONDS > 0:
+        cachePath = Path(settings.LLM_CACHE_PATH)
+        cachePath.parent.mkdir(parents=True, exist_ok=True)
+        completionStore = PersistentKeyValueStore(cachePath, tableName="chat_completions", ttlSeconds=settings.LLM_CACHE_TTL_SECONDS)
+        llm_client = CachedLlmClient(llm_client, completionStore)
     
     # Real MCP Provider for Agent A (Finance)
     finance_provider = McpToolProvider("finance", StdioServerParameters(
@@ -99,39 +110,58 @@ async def test_integration_workflow():
     # Agent B will directly use crawl4ai_agent - no adapter needed for now
     agent_c = Agent(profile_c, llm_client, model=settings.LLM_MODEL)
 
+    async def host_provider(provider, *, task_status=anyio.TASK_STATUS_IGNORED):
+        # MCP sessions are task-bound, so each provider connects and cleans up in its own task
+        try:
+            await provider.connect()
+            task_status.started()
+            await anyio.sleep_forever()
+        finally:
+            await provider.cleanup()
+
     # 5. Execute Workflow
     try:
-        # Connect providers
-        await finance_provider.connect()
-        await graphrag_provider.connect()
-        
-        logger.info("Executing Agent A task...")
-        res_a_text = await agent_a.performResearchTask("Check the latest stock prices for Energy Fuels (UUUU) using finance tools.")
-        
-        logger.info("Executing Agent B task...")
-        # Use Crawl4AI to fetch the JSON content directly
-        # target_url = "http://arduino.esp8266.com/stable/package_esp8266com_index.json"
-        target_url="https://www.sec.gov/edgar/search/#/dateRange=1y&ciks=0001801368&entityName=MP%2520Materials%2520Corp.%2520%252F%2520DE%2520(MP)%2520(CIK%25200001801368)"
-        crawled_content = await crawl4ai_agent.fetchUrl(target_url, extractMarkdown=False)
+        async with anyio.create_task_group() as provider_group:
+            # Connect providers: both docker cold-starts run at once
+            async with anyio.create_task_group() as connect_group:
+                for provider in (finance_provider, graphrag_provider):
+                    connect_group.start_soon(provider_group.start, host_provider, provider)
+            
+            async def run_agent_b():
+                logger.info("Executing Agent B task...")
+                # Use Crawl4AI to fetch the JSON content directly
+                # target_url = "http://arduino.esp8266.com/stable/package_esp8266com_index.json"
+                target_url="https://www.sec.gov/edgar/search/#/dateRange=1y&ciks=0001801368&entityName=MP%2520Materials%2520Corp.%2520%252F%2520DE%2520(MP)%2520(CIK%25200001801368)"
+                crawled_content = await crawl4ai_agent.fetchUrl(target_url, extractMarkdown=False)
+            
+                # Now ask the LLM to analyze the fetched content
+                return await agent_c.performResearchTask(
+                    f"Dive through the Insider trading report and calculate the total volumes traded:\n\n{crawled_content[:5000]}"
+                )
         
-        # Now ask the LLM to analyze the fetched content
-        res_b_text = await agent_c.performResearchTask(
-            f"Dive through the Insider trading report and calculate the total volumes traded:\n\n{crawled_content[:5000]}"
-        )
+            # Agents A and B are independent, so they run concurrently; only synthesis waits on both
+            logger.info("Executing Agent A task...")
+            res_a_text, res_b_text = await asyncio.gather(
+                agent_a.performResearchTask("Check the latest stock prices for Energy Fuels (UUUU) using finance tools."),
+                run_agent_b()
+            )
         
-        logger.info(f"Agent B result (via Crawl4AI): {res_b_text}")
+            logger.info(f"Agent B result (via Crawl4AI): {res_b_text}")
 
-        # Synthesis Phase
-        logger.info("Executing Synthesis Phase...")
-        synthesis_prompt = f"Summarize the findings from our specialists.\nTool Specialist (Agent A): {res_a_text}\nWeb Researcher (Agent B): {res_b_text}"
-        final_output = await agent_c.performResearchTask(synthesis_prompt)
+            # Synthesis Phase
+            logger.info("Executing Synthesis Phase...")
+            synthesis_prompt = f"Summarize the findings from our specialists.\nTool Specialist (Agent A): {res_a_text}\nWeb Researcher (Agent B): {res_b_text}"
+            final_output = await agent_c.performResearchTask(synthesis_prompt)
 
-        logger.info("\n=== INTEGRATION TEST COMPLETE ===")
-        logger.info(f"Final Synthesis: {final_output}")
+            logger.info("\n=== INTEGRATION TEST COMPLETE ===")
+            logger.info(f"Final Synthesis: {final_output}")
+            
+            # Releases the hosting tasks, which tear their providers down concurrently
+            provider_group.cancel_scope.cancel()
         
     finally:
-        await finance_provider.cleanup()
-        await graphrag_provider.cleanup()
+        await llm_client.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(test_integration_workflow())
+    # Same loop as the orchestrator entrypoint: uvloop when installed, stdlib asyncio otherwise
+    anyio.run(test_integration_workflow, backend="asyncio", backend_options=_eventLoopOptions())
@@ -1,5 +1,10 @@
 # Test Configuration - Settings for local LLM integration tests.
-from pydantic_settings import BaseSettings
+import functools
+import os
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+import internal_configs as cfg
 
 class TestSettings(BaseSettings):
     """Runtime configuration for local LLM tests."""
@@ -11,6 +16,10 @@ class TestSettings(BaseSettings):
     LLM_CONTEXT_LENGTH: int = 32768
     LLM_SYSTEM_PROMPT: str = "You are a helpful research assistant."
     
+    # Response cache for repeated test runs (0 disables it)
+    LLM_CACHE_TTL_SECONDS: int = 0
+    LLM_CACHE_PATH: str = os.path.join(cfg.config.CACHE_DIR, "llm_response_cache.sqlite")  # kept out of published reports
+    
     # Provider Logic (Options: 'local', 'openrouter')
     RELATIONSHIP_PROVIDER: str = "local"
     
@@ -18,8 +27,9 @@ class TestSettings(BaseSettings):
     FINANCE_TOOLS_IMAGE: str = "finance-tools"
     GRAPHRAG_IMAGE: str = "graphrag-llamaindex"
     
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", env_file_encoding="utf-8")
 
-settings = TestSettings()
+@functools.lru_cache(maxsize=1)
+def getSettings() -> TestSettings:
+    """Resolve .env and the environment on first use, not at import; later calls share the instance."""
+    return TestSettings()
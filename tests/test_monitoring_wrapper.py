@@ -0,0 +1,74 @@
+# ABOUTME: Unit tests for the monitoring patches applied by monitoring_wrapper.patch_multi_agent.
+# ABOUTME: Checks that token usage from concurrently running agents is credited to the right agent.
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import monitoring_wrapper
+import multi_agent_investment
+import output_pruner
+from multi_agent_investment import Agent, McpToolProvider, ResearchOrchestrator
+
+USAGE_BY_AGENT = {"Alpha Agent": 10, "Beta Agent": 1000}
+
+
+@pytest.fixture
+def patchedSystem(monkeypatch):
+    """Apply the monitoring patches against stand-ins, restoring every patched attribute afterwards."""
+    async def _fakeResearchTask(self, query):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_usageResponse)) as client:
+            for _ in range(3):
+                await client.post("https://llm.test/chat", json={"agent": self.profile.name})
+                await asyncio.sleep(0)
+        return "done"
+
+    for owner, attribute in (
+        (httpx.AsyncClient, "post"),
+        (ResearchOrchestrator, "executeResearchSession"),
+        (McpToolProvider, "executeMcpTool"),
+        (output_pruner, "pruneAgentOutput"),
+        (multi_agent_investment, "pruneAgentOutput"),
+        (multi_agent_investment.logger, "info"),
+    ):
+        monkeypatch.setattr(owner, attribute, getattr(owner, attribute))
+    monkeypatch.setattr(Agent, "performResearchTask", _fakeResearchTask)
+    monkeypatch.setattr(monitoring_wrapper, "state", monitoring_wrapper.MonitoringState())
+    for name in USAGE_BY_AGENT:
+        monitoring_wrapper.state.agents[name] = {"name": name, "tokensUsed": 0}
+
+    monitoring_wrapper.patch_multi_agent()
+    return monitoring_wrapper.state
+
+
+def _usageResponse(request: httpx.Request) -> httpx.Response:
+    agentName = json.loads(request.content)["agent"]
+    return httpx.Response(200, json={"usage": {"prompt_tokens": USAGE_BY_AGENT[agentName], "completion_tokens": 0}})
+
+
+def _agent(name: str) -> SimpleNamespace:
+    return SimpleNamespace(profile=SimpleNamespace(name=name))
+
+
+@pytest.mark.anyio
+async def test_concurrent_agents_are_credited_with_their_own_usage(patchedSystem):
+    await asyncio.gather(
+        Agent.performResearchTask(_agent("Alpha Agent"), "query"),
+        Agent.performResearchTask(_agent("Beta Agent"), "query")
+    )
+
+    assert patchedSystem.agents["Alpha Agent"]["tokensUsed"] == 30
+    assert patchedSystem.agents["Beta Agent"]["tokensUsed"] == 3000
+    assert patchedSystem.totalTokens == 3030
+
+
+@pytest.mark.anyio
+async def test_requests_outside_an_agent_are_not_counted(patchedSystem):
+    await Agent.performResearchTask(_agent("Alpha Agent"), "query")
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_usageResponse)) as client:
+        await client.post("https://llm.test/chat", json={"agent": "Beta Agent"})
+
+    assert patchedSystem.agents["Beta Agent"]["tokensUsed"] == 0
+    assert patchedSystem.totalTokens == 30
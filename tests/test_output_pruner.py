@@ -0,0 +1,85 @@
+# ABOUTME: Unit tests for output_pruner.pruneAgentOutput and its per-process result cache.
+# ABOUTME: Checks that cached and guarded fast paths match a full prune of the same text.
+import threading
+
+import pytest
+
+import output_pruner
+from output_pruner import (
+    BLANK_LINE_RUN_PATTERN,
+    DASH_RUN_PATTERN,
+    PRUNE_CACHE_MIN_CHARS,
+    _iterPrunedLines,
+    _pruneUncached,
+    pruneAgentOutput,
+)
+
+FINDINGS = "\n".join(f"RKLB finding {index}: backlog grew while launch cadence held steady." for index in range(80))
+HANDOFF_TEXT = f"""I'll conduct a quick analysis.
+## Phase 1: Search
+{FINDINGS}
+
+----------
+
+
+
+## Step 1: Finish
+It has NASA contracts."""
+
+
+@pytest.fixture(autouse=True)
+def emptyPruneCache(monkeypatch):
+    """Give each test a cold cache and fresh counters."""
+    monkeypatch.setattr(output_pruner, "_prunedOutputs", output_pruner.OrderedDict())
+    monkeypatch.setattr(output_pruner, "_pruneCacheStats", {"hits": 0, "misses": 0})
+
+
+@pytest.mark.parametrize("maxChars", [0, 1500])
+def test_cache_hit_matches_uncached_prune(maxChars):
+    assert len(HANDOFF_TEXT) >= PRUNE_CACHE_MIN_CHARS
+
+    firstResult = pruneAgentOutput(HANDOFF_TEXT, maxChars)
+    cachedResult = pruneAgentOutput(HANDOFF_TEXT, maxChars)
+
+    assert cachedResult == firstResult == _pruneUncached(HANDOFF_TEXT, maxChars)
+    assert output_pruner._pruneCacheStats == {"hits": 1, "misses": 1}
+
+
+def test_short_outputs_bypass_the_cache():
+    assert pruneAgentOutput("I'll conduct a quick analysis.\nRKLB is a space company.") == "RKLB is a space company."
+    assert not output_pruner._prunedOutputs
+
+
+def test_cache_stays_bounded_under_concurrent_threads(monkeypatch):
+    monkeypatch.setattr(output_pruner, "PRUNE_CACHE_SIZE", 8)
+    texts = [f"{HANDOFF_TEXT}\nVariant {index}" for index in range(32)]
+    results = {}
+
+    def _pruneAll(workerIndex):
+        results[workerIndex] = [pruneAgentOutput(text) for text in texts]
+
+    workers = [threading.Thread(target=_pruneAll, args=(workerIndex,)) for workerIndex in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    expected = [_pruneUncached(text, 0) for text in texts]
+    assert all(workerResults == expected for workerResults in results.values())
+    assert len(output_pruner._prunedOutputs) <= 8
+
+
+@pytest.mark.parametrize("rawOutput", [
+    "RKLB is a space company.\nIt has NASA contracts.",
+    "Backlog grew.\n\nMargins held.",
+    "Backlog grew.\n\n\n\nMargins held.",
+    "Table | ---- | value",
+    "Divider ---------- inside a line",
+    "Trailing newlines\n\n\n",
+])
+def test_substring_guards_do_not_change_output(rawOutput):
+    # Reference pipeline with both substitutions applied unconditionally
+    content = "\n".join(_iterPrunedLines(rawOutput.splitlines()))
+    content = DASH_RUN_PATTERN.sub("---", BLANK_LINE_RUN_PATTERN.sub("\n\n", content))
+
+    assert _pruneUncached(rawOutput, 0) == content.strip()
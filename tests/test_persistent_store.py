@@ -0,0 +1,78 @@
+# ABOUTME: Unit tests for the SQLite-backed key/value store behind the cross-session caches.
+# ABOUTME: Covers round-trips, overwrites, TTL expiry, reopening after close and per-table isolation.
+import time
+
+import pytest
+
+from persistent_store import PersistentKeyValueStore
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = PersistentKeyValueStore(tmp_path / "cache.sqlite", tableName="search_cache", ttlSeconds=60)
+    yield store
+    store.close()
+
+
+@pytest.mark.anyio
+async def test_round_trip_returns_stored_value(cache):
+    await cache.put("rklb news", "Rocket Lab won a launch contract.")
+
+    assert await cache.get("rklb news") == "Rocket Lab won a launch contract."
+    assert await cache.get("unknown query") is None
+
+
+@pytest.mark.anyio
+async def test_put_overwrites_existing_key(cache):
+    await cache.put("query", "first")
+    await cache.put("query", "second")
+
+    assert await cache.get("query") == "second"
+
+
+@pytest.mark.anyio
+async def test_entries_older_than_ttl_are_misses(cache, monkeypatch):
+    storedAt = time.time()
+    monkeypatch.setattr(time, "time", lambda: storedAt)
+    await cache.put("query", "result")
+
+    monkeypatch.setattr(time, "time", lambda: storedAt + 59)
+    assert await cache.get("query") == "result"
+
+    monkeypatch.setattr(time, "time", lambda: storedAt + 61)
+    assert await cache.get("query") is None
+
+
+@pytest.mark.anyio
+async def test_values_survive_close_and_reopen(tmp_path):
+    databasePath = tmp_path / "cache.sqlite"
+    firstSession = PersistentKeyValueStore(databasePath, tableName="search_cache", ttlSeconds=60)
+    await firstSession.put("query", "persisted")
+    firstSession.close()
+
+    secondSession = PersistentKeyValueStore(databasePath, tableName="search_cache", ttlSeconds=60)
+    try:
+        assert await secondSession.get("query") == "persisted"
+    finally:
+        secondSession.close()
+
+
+@pytest.mark.anyio
+async def test_tables_in_one_file_are_independent(tmp_path):
+    databasePath = tmp_path / "cache.sqlite"
+    searchStore = PersistentKeyValueStore(databasePath, tableName="search_cache", ttlSeconds=60)
+    completionStore = PersistentKeyValueStore(databasePath, tableName="chat_completions", ttlSeconds=60)
+    try:
+        await searchStore.put("query", "search result")
+        await completionStore.put("query", "completion")
+
+        assert await searchStore.get("query") == "search result"
+        assert await completionStore.get("query") == "completion"
+    finally:
+        searchStore.close()
+        completionStore.close()
+
+
+def test_table_name_must_be_an_identifier(tmp_path):
+    with pytest.raises(ValueError, match="Invalid table name"):
+        PersistentKeyValueStore(tmp_path / "cache.sqlite", tableName="cache; DROP TABLE x", ttlSeconds=60)
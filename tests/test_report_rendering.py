@@ -0,0 +1,67 @@
+# ABOUTME: Golden-output tests for the compiled markdown report templates.
+# ABOUTME: Checks compiled rendering is byte-for-byte identical to str.format on the same template.
+import pytest
+
+import internal_configs as cfg
+from multi_agent_investment import (
+    MOMENTUM_ONLY_RECOMMENDATION,
+    MOMENTUM_TRACK_MODES,
+    ResearchOrchestrator,
+    _compileTemplate,
+    _renderTemplate,
+)
+
+# Non-ASCII text, braces and markdown in values must pass through untouched
+SAMPLE_RESULT = {
+    "query": "Analyze Energy Fuels (UUUU) — rare earths",
+    "agents": {
+        "qualitative": {"analysis": "Moat: {licensed mills} ✓", "clarification": "Risk #1: permitting"},
+        "quantitative": {"analysis": "P/E 42.1\n\n| Metric | Value |", "clarification": ""},
+        "synthesis": {"finalRecommendation": "Accumulate below $5 — 12-month view"},
+        "momentum": {"analysis": "Breakout above 50-day MA"},
+    },
+}
+
+
+def _expectedReport(mode: str) -> bytes:
+    """Reference rendering: plain str.format over the same template text, encoded once."""
+    template = cfg.MARKDOWN_REPORT_TEMPLATE + (cfg.MOMENTUM_REPORT_SECTION if mode in MOMENTUM_TRACK_MODES else "")
+    agents = SAMPLE_RESULT["agents"]
+    return template.format(
+        query=SAMPLE_RESULT["query"],
+        qualAnalysis=agents["qualitative"]["analysis"],
+        qualClarification=agents["qualitative"]["clarification"],
+        quantAnalysis=agents["quantitative"]["analysis"],
+        quantClarification=agents["quantitative"]["clarification"],
+        finalRecommendation=agents["synthesis"]["finalRecommendation"],
+        momentumAnalysis=agents["momentum"]["analysis"],
+    ).encode("utf-8")
+
+
+@pytest.mark.parametrize("mode", cfg.config.RESEARCH_MODES)
+def test_report_matches_str_format_for_every_mode(mode):
+    rendered = ResearchOrchestrator._renderResearchReport(dict(SAMPLE_RESULT, mode=mode))
+
+    assert rendered == _expectedReport(mode)
+    assert (b"Breakout above 50-day MA" in rendered) == (mode in MOMENTUM_TRACK_MODES)
+
+
+def test_momentum_only_report_uses_placeholder_recommendation():
+    agents = dict(SAMPLE_RESULT["agents"], synthesis={})
+
+    rendered = ResearchOrchestrator._renderResearchReport(dict(SAMPLE_RESULT, mode="momentum", agents=agents))
+
+    assert MOMENTUM_ONLY_RECOMMENDATION.encode("utf-8") in rendered
+
+
+def test_escaped_braces_and_repeated_fields_render_like_str_format():
+    template = "{{literal}} {name} and {name} again — {other}{{"
+
+    rendered = _renderTemplate(_compileTemplate(template), name="ÄB", other=3)
+
+    assert rendered == template.format(name="ÄB", other=3).encode("utf-8")
+
+
+def test_format_specs_are_rejected():
+    with pytest.raises(ValueError):
+        _compileTemplate("{value:>10}")
@@ -0,0 +1,110 @@
+# ABOUTME: Unit tests for ResearchOrchestrator._runResearchPhases with the agent phases stubbed out.
+# ABOUTME: Covers cancellation between concurrent phases, the per-session journal file and report export cleanup.
+import asyncio
+from datetime import datetime
+
+import anyio
+import pytest
+
+import internal_configs as cfg
+import multi_agent_investment
+from multi_agent_investment import ResearchOrchestrator, ResearchResult
+
+
+def _orchestrator(tmp_path, mode: str = "fundamental") -> ResearchOrchestrator:
+    """Orchestrator shell without agents or providers; tests attach the phase stubs they need."""
+    orchestrator = object.__new__(ResearchOrchestrator)
+    orchestrator.mode = mode
+    orchestrator.outputDirStr = str(tmp_path)
+
+    async def _phase1(query):
+        return (
+            ResearchResult("Qualitative", "Qualitative findings", datetime.now()),
+            ResearchResult("Quantitative", "Quantitative findings", datetime.now())
+        )
+
+    orchestrator.phase1_ParallelAnalysis = _phase1
+    return orchestrator
+
+
+@pytest.fixture(autouse=True)
+def noPhaseThrottle(monkeypatch):
+    monkeypatch.setattr(cfg.config, "PHASE_THROTTLE_SECONDS", 0)
+
+
+@pytest.mark.anyio
+async def test_failed_synthesis_cancels_clarification_before_returning(tmp_path):
+    orchestrator = _orchestrator(tmp_path)
+    clarificationState = {"started": False, "cancelled": False}
+
+    async def _failingSynthesis(qualAnalysis, quantAnalysis):
+        await anyio.sleep(0)
+        raise RuntimeError("synthesis model unavailable")
+
+    async def _slowClarification(qualAnalysis, quantAnalysis):
+        clarificationState["started"] = True
+        try:
+            await anyio.sleep_forever()
+        except anyio.get_cancelled_exc_class():
+            clarificationState["cancelled"] = True
+            raise
+
+    orchestrator.phase2_Synthesis = _failingSynthesis
+    orchestrator.phase3_Clarification = _slowClarification
+
+    with anyio.fail_after(5):
+        result = await orchestrator._runResearchPhases("Research RKLB")
+
+    assert result == {"error": "synthesis model unavailable"}
+    assert clarificationState == {"started": True, "cancelled": True}
+
+
+def _momentumOrchestrator(tmp_path, journalPaths, exportedQueries) -> ResearchOrchestrator:
+    orchestrator = _orchestrator(tmp_path, mode="momentum")
+    recordJournal = orchestrator._journalPhase
+
+    async def _momentum(qualAnalysis, quantAnalysis, qualClar, quantClar):
+        return "Momentum profile"
+
+    async def _journal(journalPath, *sections):
+        journalPaths.add(journalPath)
+        await recordJournal(journalPath, *sections)
+
+    async def _export(result):
+        exportedQueries.append(result["query"])
+
+    orchestrator.phase_MomentumStyling = _momentum
+    orchestrator._journalPhase = _journal
+    orchestrator.exportResearchReport = _export
+    return orchestrator
+
+
+@pytest.mark.anyio
+async def test_concurrent_sessions_keep_separate_journals(tmp_path):
+    journalPaths, exportedQueries = set(), []
+
+    results = await asyncio.gather(
+        _momentumOrchestrator(tmp_path, journalPaths, exportedQueries)._runResearchPhases("Research RKLB"),
+        _momentumOrchestrator(tmp_path, journalPaths, exportedQueries)._runResearchPhases("Research ASTS")
+    )
+
+    assert all("error" not in result for result in results)
+    assert sorted(exportedQueries) == ["Research ASTS", "Research RKLB"]
+    assert len(journalPaths) == 2
+    assert not list(tmp_path.glob("*.partial"))
+
+
+@pytest.mark.anyio
+async def test_failed_report_publish_removes_staged_file(tmp_path, monkeypatch):
+    orchestrator = _orchestrator(tmp_path)
+    monkeypatch.setattr(ResearchOrchestrator, "_renderResearchReport", staticmethod(lambda result: b"# Report"))
+
+    def _failingReplace(source, destination):
+        raise PermissionError("output directory is read-only")
+
+    monkeypatch.setattr(multi_agent_investment.os, "replace", _failingReplace)
+
+    with pytest.raises(PermissionError):
+        await orchestrator.exportResearchReport({"mode": "fundamental"})
+
+    assert list(tmp_path.iterdir()) == []
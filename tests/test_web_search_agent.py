@@ -0,0 +1,161 @@
+# ABOUTME: Unit tests for WebSearchAgent's in-process caching and single-flight search.
+# ABOUTME: The live lookup is replaced by a controllable coroutine, so no network is used.
+import asyncio
+
+import pytest
+
+import multi_agent_investment
+from multi_agent_investment import WebSearchAgent
+
+
+class _ControlledLookup:
+    """Stands in for WebSearchAgent._resolveSearch and holds every call until released."""
+
+    def __init__(self, failure: Exception = None):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.failure = failure
+
+    async def __call__(self, query, cacheKey, maxResults):
+        self.calls.append(cacheKey)
+        await self.release.wait()
+        if self.failure is not None:
+            raise self.failure
+        return f"result for {cacheKey}"
+
+
+def _searchAgent(lookup) -> WebSearchAgent:
+    agent = WebSearchAgent(apiKey="test-key")
+    agent._resolveSearch = lookup
+    return agent
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_queries_share_one_lookup():
+    lookup = _ControlledLookup()
+    agent = _searchAgent(lookup)
+
+    leader = asyncio.create_task(agent.search("RKLB news"))
+    follower = asyncio.create_task(agent.search("rklb   news?"))
+    await asyncio.sleep(0)
+    lookup.release.set()
+
+    assert await leader == await follower == "result for rklb news"
+    assert lookup.calls == ["rklb news"]
+    assert agent.inflightSearches == {}
+
+
+@pytest.mark.anyio
+async def test_leader_error_reaches_joined_callers():
+    lookup = _ControlledLookup(failure=RuntimeError("search backend down"))
+    agent = _searchAgent(lookup)
+
+    leader = asyncio.create_task(agent.search("rklb news"))
+    follower = asyncio.create_task(agent.search("rklb news"))
+    await asyncio.sleep(0)
+    lookup.release.set()
+
+    results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert lookup.calls == ["rklb news"]
+    assert agent.inflightSearches == {}
+
+
+@pytest.mark.anyio
+async def test_follower_takes_over_when_leader_is_cancelled():
+    lookup = _ControlledLookup()
+    agent = _searchAgent(lookup)
+
+    leader = asyncio.create_task(agent.search("rklb news"))
+    follower = asyncio.create_task(agent.search("rklb news"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    lookup.release.set()
+
+    assert await follower == "result for rklb news"
+    assert leader.cancelled()
+    assert lookup.calls == ["rklb news", "rklb news"]
+
+
+@pytest.mark.anyio
+async def test_cancelled_follower_does_not_restart_or_disturb_leader():
+    lookup = _ControlledLookup()
+    agent = _searchAgent(lookup)
+
+    leader = asyncio.create_task(agent.search("rklb news"))
+    follower = asyncio.create_task(agent.search("rklb news"))
+    await asyncio.sleep(0)
+    follower.cancel()
+    await asyncio.sleep(0)
+    lookup.release.set()
+
+    assert await leader == "result for rklb news"
+    assert follower.cancelled()
+    assert lookup.calls == ["rklb news"]
+
+
+@pytest.mark.anyio
+async def test_follower_cancelled_with_leader_stays_cancelled():
+    lookup = _ControlledLookup()
+    agent = _searchAgent(lookup)
+
+    leader = asyncio.create_task(agent.search("rklb news"))
+    follower = asyncio.create_task(agent.search("rklb news"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    follower.cancel()
+    lookup.release.set()
+    await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert leader.cancelled() and follower.cancelled()
+    assert lookup.calls == ["rklb news"]
+
+
+@pytest.mark.parametrize("query", ["RKLB news", "  rklb\tnews ", "rklb   news?", "RKLB NEWS!!"])
+def test_normalize_query_folds_case_whitespace_and_trailing_punctuation(query):
+    assert WebSearchAgent._normalizeQuery(query) == "rklb news"
+
+
+def test_normalize_query_keeps_inner_punctuation():
+    assert WebSearchAgent._normalizeQuery("U.S. GDP, Q3?") == "u.s. gdp, q3"
+
+
+def test_memory_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(multi_agent_investment, "WEB_SEARCH_MEMORY_CACHE_SIZE", 2)
+    agent = WebSearchAgent(apiKey="test-key")
+
+    agent._cacheResult("first", "one")
+    agent._cacheResult("second", "two")
+    assert agent._getCachedResult("first") == "one"
+    agent._cacheResult("third", "three")
+
+    assert agent._getCachedResult("second") is None
+    assert agent._getCachedResult("first") == "one"
+    assert agent._getCachedResult("third") == "three"
+
+
+def test_memory_cache_expires_after_ttl(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(multi_agent_investment.time, "monotonic", lambda: clock[0])
+    agent = WebSearchAgent(apiKey="test-key")
+    agent.memoryTtlSeconds = 60
+
+    agent._cacheResult("rklb news", "fresh")
+    clock[0] += 60
+    assert agent._getCachedResult("rklb news") == "fresh"
+    clock[0] += 1
+
+    assert agent._getCachedResult("rklb news") is None
+    assert "rklb news" not in agent.searchCache
+
+
+def test_zero_ttl_disables_memory_cache():
+    agent = WebSearchAgent(apiKey="test-key")
+    agent.memoryTtlSeconds = 0
+
+    agent._cacheResult("rklb news", "result")
+
+    assert agent._getCachedResult("rklb news") is None
+    assert not agent.searchCache